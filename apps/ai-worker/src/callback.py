@@ -3,7 +3,10 @@
 HTTP callback sender for notifying Node.js backend of processing results.
 """
 
+from typing import Optional
+
 import httpx
+import orjson
 
 from .config import settings
 from .logging_config import get_logger
@@ -11,6 +14,36 @@ from .models import ProcessingResult
 
 logger = get_logger(__name__)
 
+# Increased timeout for large documents
+CALLBACK_TIMEOUT = httpx.Timeout(
+    connect=10.0,
+    read=120.0,
+    write=120.0,
+    pool=10.0,
+)
+
+# Shared client: keeps the connection pool and keep-alive across callbacks
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_callback_client() -> httpx.AsyncClient:
+    """Get shared AsyncClient for callbacks, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=CALLBACK_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _client
+
+
+async def close_callback_client() -> None:
+    """Close the shared callback client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def send_callback(
     document_id: str,
@@ -45,27 +78,26 @@ async def send_callback(
         }
 
     try:
-        # Increased timeout for large documents
-        timeout = httpx.Timeout(
-            connect=10.0,
-            read=120.0,
-            write=120.0,
-            pool=10.0,
+        client = get_callback_client()
+        # orjson serializes large markdown payloads much faster than stdlib json.
+        # Serialize once; httpx sends bytes as-is with a Content-Length header.
+        # Dense vectors arrive as numpy rows and are written without tolist().
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        response = await client.post(
+            settings.callback_url,
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+        logger.info(
+            "callback_sent",
+            document_id=document_id,
+            success=result.success,
+            status_code=response.status_code,
+            payload_bytes=len(body),
         )
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                settings.callback_url,
-                json=payload,
-            )
-            response.raise_for_status()
-
-            logger.info(
-                "callback_sent",
-                document_id=document_id,
-                success=result.success,
-                status_code=response.status_code,
-            )
-            return True
+        return True
 
     except httpx.HTTPStatusError as e:
         logger.error(
@@ -1,14 +1,12 @@
-# apps/ai-worker/src/chunkers/document_chunker.py
 """
 Document chunker based on Markdown header structure.
 Preserves hierarchy via breadcrumbs.
 """
 
-from typing import Any, Dict, List
-from langchain_text_splitters import (
-    MarkdownHeaderTextSplitter,
-    RecursiveCharacterTextSplitter,
-)
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 
 class DocumentChunker:
@@ -16,15 +14,15 @@ class DocumentChunker:
     Split Markdown documents by headers while maintaining hierarchy context.
     """
 
-    # All supported header levels (H1-H6)
-    ALL_HEADERS = [
-        ("#", "Header 1"),
-        ("##", "Header 2"),
-        ("###", "Header 3"),
-        ("####", "Header 4"),
-        ("#####", "Header 5"),
-        ("######", "Header 6"),
-    ]
+    # One pass over the text finds both ATX headers (# .. ######) and code
+    # fences (``` / ~~~); headers inside fenced code blocks are not split on.
+    _LINE_PATTERN = re.compile(
+        r"^[ \t]*(?:"
+        r"(?P<fence>```|~~~)"
+        r"|(?P<hashes>#{1,6})(?:[ \t]+(?P<title>[^\n]*?))?[ \t]*$"
+        r")",
+        re.MULTILINE,
+    )
 
     def __init__(
         self, chunk_size: int = 1000, chunk_overlap: int = 100, header_levels: int = 3
@@ -33,11 +31,6 @@ class DocumentChunker:
         self.chunk_overlap = chunk_overlap
         self.header_levels = min(max(header_levels, 1), 6)  # Clamp to 1-6
 
-        # Build headers_to_split_on based on configured levels
-        headers_to_split_on = self.ALL_HEADERS[: self.header_levels]
-        self.header_splitter = MarkdownHeaderTextSplitter(
-            headers_to_split_on=headers_to_split_on
-        )
         self.recursive_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -56,6 +49,56 @@ class DocumentChunker:
             },
         }
 
+    def _split_by_headers(self, text: str) -> Iterator[Tuple[List[str], str]]:
+        """
+        Yield (breadcrumbs, section content) pairs in document order.
+
+        Section content is the original text between two headers (stripped),
+        so paragraphs, indentation and code blocks are kept as written.
+        Only headers up to self.header_levels start a new section.
+        Sections are yielded as soon as the next header is found, so chunk()
+        sizes and sub-splits each one without an intermediate list.
+        """
+        # Stack of (level, title) for the currently open headers
+        header_stack: List[Tuple[int, str]] = []
+        section_start = 0
+        open_fence = ""
+
+        for match in self._LINE_PATTERN.finditer(text):
+            fence = match.group("fence")
+            if fence:
+                if not open_fence:
+                    # A line with a second ``` is inline code, not a fence
+                    line_end = text.find("\n", match.end())
+                    line = text[match.start() : line_end if line_end != -1 else None]
+                    if fence == "~~~" or line.count("```") == 1:
+                        open_fence = fence
+                elif fence == open_fence:
+                    open_fence = ""
+                continue
+
+            if open_fence:
+                continue
+
+            level = len(match.group("hashes"))
+            if level > self.header_levels:
+                continue
+
+            content = text[section_start : match.start()].strip()
+            if content:
+                breadcrumbs = [title for _, title in header_stack if title]
+                yield breadcrumbs, content
+
+            while header_stack and header_stack[-1][0] >= level:
+                header_stack.pop()
+            header_stack.append((level, (match.group("title") or "").strip()))
+            section_start = match.end() + 1
+
+        content = text[section_start:].strip()
+        if content:
+            breadcrumbs = [title for _, title in header_stack if title]
+            yield breadcrumbs, content
+
     def chunk(self, text: str) -> List[Dict[str, Any]]:
         """
         Split Markdown text into chunks with breadcrumbs metadata.
@@ -63,38 +106,35 @@ class DocumentChunker:
         if not text or not text.strip():
             return []
 
-        # 1. Split by headers
-        header_splits = self.header_splitter.split_text(text)
-
         final_chunks = []
+        # Sections under the same header path share one prefix string
+        prefix_cache: Dict[Tuple[str, ...], str] = {}
 
-        for split in header_splits:
-            # Extract headers from metadata to build breadcrumbs
-            breadcrumbs = []
-            for i in range(1, self.header_levels + 1):
-                key = f"Header {i}"
-                if key in split.metadata:
-                    breadcrumbs.append(split.metadata[key])
-
+        # 1. Split by headers, handling each section as it is found
+        for breadcrumbs, section in self._split_by_headers(text):
             # 2. Format breadcrumbs as a context header
-            context_prefix = ""
-            if breadcrumbs:
-                context_prefix = "> " + " > ".join(breadcrumbs) + "\n\n"
+            path = tuple(breadcrumbs)
+            context_prefix = prefix_cache.get(path)
+            if context_prefix is None:
+                context_prefix = ""
+                if breadcrumbs:
+                    context_prefix = "> " + " > ".join(breadcrumbs) + "\n\n"
+                prefix_cache[path] = context_prefix
 
-            chunk_content = context_prefix + split.page_content
-
-            # 3. Check if this split is too large
-            if len(chunk_content) > self.chunk_size:
+            # 3. Check if this split is too large (before building the string)
+            if len(context_prefix) + len(section) > self.chunk_size:
                 # Sub-split large section recursively
-                sub_chunks = self.recursive_splitter.split_text(split.page_content)
-                for sub_text in sub_chunks:
-                    content = context_prefix + sub_text
+                for sub_text in self.recursive_splitter.split_text(section):
                     final_chunks.append(
-                        self._create_chunk(content, breadcrumbs, len(final_chunks))
+                        self._create_chunk(
+                            context_prefix + sub_text, breadcrumbs, len(final_chunks)
+                        )
                     )
             else:
                 final_chunks.append(
-                    self._create_chunk(chunk_content, breadcrumbs, len(final_chunks))
+                    self._create_chunk(
+                        context_prefix + section, breadcrumbs, len(final_chunks)
+                    )
                 )
 
         return final_chunks
@@ -14,6 +14,11 @@ class PresentationChunker:
     Groups small slides together to avoid tiny fragments.
     """
 
+    # First Markdown H1 header (# Title): exactly one # followed by spaces/tabs
+    _H1_PATTERN = re.compile(r"^#[ \t]+(.+)$", re.MULTILINE)
+    # Titles sit at the top of a slide; only the head of a chunk is searched
+    _TITLE_SEARCH_CHARS = 2048
+
     def __init__(self, min_chunk_size: int = 200):
         self.min_chunk_size = min_chunk_size
         self.marker = "<!-- slide -->"
@@ -37,6 +42,8 @@ class PresentationChunker:
         final_chunks = []
         current_accumulation = []
         current_indices = []
+        # Running length of current_accumulation (avoids re-summing every slide)
+        current_total = 0
 
         for i, slide_content in enumerate(raw_slides):
             slide_nr = i + 1
@@ -48,17 +55,17 @@ class PresentationChunker:
 
             current_accumulation.append(content)
             current_indices.append(slide_nr)
-
-            total_size = sum(len(s) for s in current_accumulation)
+            current_total += len(content)
 
             # If we met the minimum size or this is the last slide, emit a chunk
-            if total_size >= self.min_chunk_size or i == len(raw_slides) - 1:
+            if current_total >= self.min_chunk_size or i == len(raw_slides) - 1:
                 chunk = self._create_chunk(
                     current_accumulation, current_indices, len(final_chunks)
                 )
                 final_chunks.append(chunk)
                 current_accumulation = []
                 current_indices = []
+                current_total = 0
 
         # If anything is left over (e.g., the last slide was empty but we had an accumulation)
         if current_accumulation:
@@ -100,10 +107,18 @@ class PresentationChunker:
 
     def _extract_title(self, text: str) -> Optional[str]:
         """
-        Extract the first Markdown H1 header (# Title) from text.
+        Extract the first Markdown H1 header (# Title) from the head of text.
+
+        The search stops at the end of the line containing character
+        _TITLE_SEARCH_CHARS, so a title is never cut short.
         """
-        # Matches lines starting with exactly one # followed by whitespace
-        match = re.search(r"^#\s+(.+)$", text, re.MULTILINE)
+        end = text.find("\n", self._TITLE_SEARCH_CHARS)
+        if end == -1:
+            end = len(text)
+        # Cheap substring check before running the regex
+        if text.find("#", 0, end) == -1:
+            return None
+        match = self._H1_PATTERN.search(text, 0, end)
         if match:
             return match.group(1).strip()
         return None
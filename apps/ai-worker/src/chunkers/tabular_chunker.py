@@ -1,6 +1,7 @@
 # apps/ai-worker/src/chunkers/tabular_chunker.py
 
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, Iterator, List
 
 
 class TabularChunker:
@@ -8,47 +9,69 @@ class TabularChunker:
     Split tabular content by rows or maintain as single chunks for small tables.
     """
 
+    # Markdown table separator row after a header line: |---|, | --- |, |:--:|
+    _TABLE_SEPARATOR_PATTERN = re.compile(r"\n\|[ \t]*:?-+:?[ \t]*\|")
+    # First non-whitespace character, i.e. where a section's content starts
+    _CONTENT_START_PATTERN = re.compile(r"\S")
+    # Sheets are separated by a horizontal rule between blank lines
+    _SHEET_DELIMITER = "\n\n---\n\n"
+
     def __init__(self, rows_per_chunk: int = 20):
         self.rows_per_chunk = rows_per_chunk
 
+    def _iter_sections(self, text: str) -> Iterator[str]:
+        """Yield stripped, non-empty sheet sections in order."""
+        delimiter = self._SHEET_DELIMITER
+        start = 0
+        while True:
+            end = text.find(delimiter, start)
+            section = (text[start:] if end == -1 else text[start:end]).strip()
+            if section:
+                yield section
+            if end == -1:
+                return
+            start = end + len(delimiter)
+
     def chunk(self, text: str) -> List[Dict[str, Any]]:
         if not text or not text.strip():
             return []
 
-        # 1. Split by --- (multiple sheets)
-        delimiter = "\n\n---\n\n"
-        if delimiter in text:
-            sections = [s.strip() for s in text.split(delimiter) if s.strip()]
-        else:
-            sections = [text.strip()]
-
         final_chunks = []
 
-        for section in sections:
+        # 1. Walk sections separated by --- (multiple sheets)
+        for section in self._iter_sections(text):
             # 2. Extract breadcrumbs (Sheet Name from H1)
-            lines = section.split("\n")
             breadcrumbs = []
-            content_start_idx = 0
-
-            # Check if first line is a H1 Header (Sheet Name)
-            if lines and lines[0].startswith("# "):
-                sheet_name = lines[0][2:].strip()
+            content_start = 0
+
+            # Check if first line is a H1 Header (Sheet Name); track where the
+            # content begins instead of copying the rest of the section
+            if section.startswith("# "):
+                line_end = section.find("\n")
+                if line_end == -1:
+                    line_end = len(section)
+                sheet_name = section[2:line_end].strip()
                 breadcrumbs.append(sheet_name)
-                content_start_idx = 1
+                content_start = line_end + 1
 
-            # Clean content (exclude the extracted header line)
-            content_lines = lines[content_start_idx:]
-            content_text = "\n".join(content_lines).strip()
-
-            if not content_text:
+            # Skip blank lines after the header line (section end is stripped)
+            first_char = self._CONTENT_START_PATTERN.search(section, content_start)
+            if first_char is None:
                 continue
+            content_start = first_char.start()
 
             # 3. Determine Format Strategy
-            # Check for Markdown Table syntax (| col | col | + separator |---|)
+            # Check for Markdown Table syntax (| col | col | + separator |---|).
+            # The separator follows the header row, so only the first two
+            # content lines are scanned, however large the section is.
+            head_end = section.find("\n", content_start)
+            if head_end != -1:
+                head_end = section.find("\n", head_end + 1)
+            if head_end == -1:
+                head_end = len(section)
             is_markdown_table = (
-                "|" in content_text
-                and "\n|-" in content_text
-                and content_text.count("|") > 2
+                self._TABLE_SEPARATOR_PATTERN.search(section, content_start, head_end)
+                is not None
             )
 
             if is_markdown_table:
@@ -66,21 +89,18 @@ class TabularChunker:
             else:
                 # STRATEGY B: Sentence Format -> Split by rows
                 # Assumes rows are separated by double newlines (from converter)
+                content_text = section[content_start:] if content_start else section
                 rows = [r.strip() for r in content_text.split("\n\n") if r.strip()]
 
                 if not rows:
                     continue
 
+                header = f"# {breadcrumbs[0]}\n\n" if breadcrumbs else ""
+
                 # Batch rows into chunks
                 for i in range(0, len(rows), self.rows_per_chunk):
                     batch = rows[i : i + self.rows_per_chunk]
-                    batch_text = "\n\n".join(batch)
-
-                    if breadcrumbs:
-                        header_line = f"# {breadcrumbs[0]}"
-                        chunk_display_text = f"{header_line}\n\n{batch_text}"
-                    else:
-                        chunk_display_text = batch_text
+                    chunk_display_text = header + "\n\n".join(batch)
 
                     final_chunks.append(
                         {
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     ocr_mode: Literal["auto", "force", "never"] = "auto"
     ocr_languages: str = "en"  # Comma-separated: "en,vi"
 
+    # Docling PDF: load models at startup instead of on the first request
+    docling_warmup: bool = False
+    docling_warmup_ocr_modes: str = "auto"  # Comma-separated: "auto,never"
+
     # Processing
     processing_timeout: int = 300  # 5 minutes
     # Note: Concurrency is controlled by BullMQ's PDF_CONCURRENCY env var
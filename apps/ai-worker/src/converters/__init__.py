@@ -1,18 +1,55 @@
 # apps/ai-worker/src/converters/__init__.py
-"""Format converters for document processing."""
+"""
+Format converters for document processing.
+
+Converter classes are imported on first access (PEP 562), so a format's
+dependencies (e.g. pandas for XLSX) only load when that format is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .base import FormatConverter
-from .csv_converter import CsvConverter
-from .docx_converter import DocxConverter
-from .epub_converter import EpubConverter
-from .html_converter import HtmlConverter
-from .json_converter import JsonConverter
-from .md_converter import MarkdownConverter
-from .pdf_converter import DoclingPdfConverter
-from .pptx_converter import PptxConverter
-from .pymupdf_converter import PyMuPDFConverter
-from .txt_converter import TxtConverter
-from .xlsx_converter import XlsxConverter
+
+if TYPE_CHECKING:
+    from .csv_converter import CsvConverter
+    from .docx_converter import DocxConverter
+    from .epub_converter import EpubConverter
+    from .html_converter import HtmlConverter
+    from .json_converter import JsonConverter
+    from .md_converter import MarkdownConverter
+    from .pdf_converter import DoclingPdfConverter
+    from .pptx_converter import PptxConverter
+    from .pymupdf_converter import PyMuPDFConverter
+    from .txt_converter import TxtConverter
+    from .xlsx_converter import XlsxConverter
+
+# Converter class name → module that defines it
+_CONVERTER_MODULES = {
+    "CsvConverter": "csv_converter",
+    "DoclingPdfConverter": "pdf_converter",
+    "DocxConverter": "docx_converter",
+    "EpubConverter": "epub_converter",
+    "HtmlConverter": "html_converter",
+    "JsonConverter": "json_converter",
+    "MarkdownConverter": "md_converter",
+    "PptxConverter": "pptx_converter",
+    "PyMuPDFConverter": "pymupdf_converter",
+    "TxtConverter": "txt_converter",
+    "XlsxConverter": "xlsx_converter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _CONVERTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    converter = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = converter
+    return converter
+
 
 __all__ = [
     "FormatConverter",
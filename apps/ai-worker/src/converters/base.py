@@ -1,8 +1,13 @@
 # apps/ai-worker/src/converters/base.py
 """Base class for format converters using Strategy Pattern."""
 
+import mmap
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Literal
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Literal, Union
 
 from src.models import ProcessorOutput
 from src.normalizer import MarkdownNormalizer
@@ -24,6 +29,10 @@ class FormatConverter(ABC):
     _sanitizer = InputSanitizer()
     _normalizer = MarkdownNormalizer()
 
+    # Bytes scanned at each end of a PDF, and at its last startxref offset
+    _PDF_SCAN_BYTES = 4096
+    _STARTXREF_PATTERN = re.compile(rb"startxref\s+(\d+)")
+
     @abstractmethod
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """
@@ -37,6 +46,65 @@ class FormatConverter(ABC):
         """
         pass
 
+    @staticmethod
+    @contextmanager
+    def _open_mapped(path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+        """
+        Map a file read-only for decoding.
+        str(data, encoding) decodes straight from the page cache, so the
+        file is never copied into a Python bytes object first.
+
+        Args:
+            path: File to map.
+
+        Yields:
+            Read-only mmap of the file (b"" for empty files, which mmap rejects).
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def _pdf_may_be_encrypted(self, path: Path) -> bool:
+        """
+        Cheap encryption pre-check that reads a few KiB instead of parsing.
+        Encrypted PDFs reference an /Encrypt dictionary from their trailer
+        (or xref stream dictionary), which sits at the end of the file, at
+        the last startxref offset, or (linearized files) near the start.
+
+        Args:
+            path: PDF file to check.
+
+        Returns:
+            False if no /Encrypt entry was found; True if the PDF may be
+            encrypted and needs a full check.
+        """
+        try:
+            with open(path, "rb") as f:
+                head = f.read(self._PDF_SCAN_BYTES)
+                if b"/Encrypt" in head:
+                    return True
+
+                size = os.fstat(f.fileno()).st_size
+                f.seek(max(0, size - self._PDF_SCAN_BYTES))
+                tail = f.read()
+                if b"/Encrypt" in tail:
+                    return True
+
+                startxref = None
+                for startxref in self._STARTXREF_PATTERN.finditer(tail):
+                    pass
+                if startxref is None:
+                    # Unusual layout; let the full check decide
+                    return True
+
+                f.seek(int(startxref.group(1)))
+                return b"/Encrypt" in f.read(self._PDF_SCAN_BYTES)
+        except (OSError, ValueError):
+            return True
+
     def _sanitize_raw(self, text: str) -> str:
         """
         Sanitize raw text before formatting.
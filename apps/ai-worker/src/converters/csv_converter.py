@@ -1,13 +1,12 @@
 # apps/ai-worker/src/converters/csv_converter.py
 """CSV converter - wraps existing CsvProcessor logic."""
 
+import asyncio
 import csv
 import io
+import mmap
 from pathlib import Path
-from typing import Any, Dict, List
-
-import chardet
-import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -27,6 +26,16 @@ class CsvConverter(FormatConverter):
 
     category = "tabular"
 
+    # Header keywords for Phase 4 smart number formatting
+    _CURRENCY_KEYWORDS = ("revenue", "price", "cost", "salary", "usd", "amount")
+    _IDENTIFIER_KEYWORDS = ("id", "code", "year")  # No thousands separator
+
+    # Bytes handed to chardet when the file is not valid UTF-8
+    _ENCODING_SAMPLE_BYTES = 64 * 1024
+
+    # Delimiters considered when detecting the CSV dialect
+    _DELIMITERS = ",;\t|"
+
     def __init__(self, max_table_rows: int = 35, max_table_cols: int = 20):
         """Initialize converter with configurable table size thresholds.
 
@@ -39,6 +48,11 @@ class CsvConverter(FormatConverter):
 
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """Convert CSV to Markdown."""
+        # Reading, parsing and formatting are blocking; keep the event loop free
+        return await asyncio.to_thread(self._to_markdown_sync, file_path)
+
+    def _to_markdown_sync(self, file_path: str) -> ProcessorOutput:
+        """Blocking CSV to Markdown conversion, run in a worker thread."""
         try:
             path = Path(file_path)
             if not path.exists():
@@ -46,13 +60,13 @@ class CsvConverter(FormatConverter):
                     markdown="", metadata={"error": f"File not found: {file_path}"}
                 )
 
-            raw_bytes = path.read_bytes()
-            if not raw_bytes:
-                return ProcessorOutput(markdown="", metadata={})
+            with self._open_mapped(path) as raw_bytes:
+                if not raw_bytes:
+                    return ProcessorOutput(markdown="", metadata={})
 
-            encoding = self._detect_encoding(raw_bytes)
-            # Use 'replace' to avoid crashing on bad bytes before sanitization
-            content = raw_bytes.decode(encoding, errors="replace")
+                encoding = self._detect_encoding(raw_bytes)
+                # Use 'replace' to avoid crashing on bad bytes before sanitization
+                content = str(raw_bytes, encoding, errors="replace")
             content = content.lstrip("\ufeff")
 
             # Phase 4: Input Sanitization (Delegate to base class if implemented there,
@@ -63,29 +77,26 @@ class CsvConverter(FormatConverter):
                 return ProcessorOutput(markdown="", metadata={})
 
             delimiter = self._detect_delimiter(content)
-            df = self._parse_csv(content, delimiter)
+            headers, rows = self._parse_csv(content, delimiter)
 
-            if df.empty and len(df.columns) == 0:
+            if not headers:
                 return ProcessorOutput(markdown="", metadata={})
 
             metadata: Dict[str, Any] = {
-                "row_count": len(df),
-                "column_count": len(df.columns),
+                "row_count": len(rows),
+                "column_count": len(headers),
                 "encoding": encoding,
                 "delimiter": delimiter,
                 "strategy": "unknown",
             }
 
             # Phase 4: Decision Logic
-            if (
-                len(df) <= self.max_table_rows
-                and len(df.columns) <= self.max_table_cols
-            ):
+            if len(rows) <= self.max_table_rows and len(headers) <= self.max_table_cols:
                 metadata["strategy"] = "markdown_table"
-                markdown = self._to_markdown_table(df)
+                markdown = self._to_markdown_table(headers, rows)
             else:
                 metadata["strategy"] = "sentence_serialization"
-                markdown = self._to_sentence_format(df)
+                markdown = self._to_sentence_format(headers, rows)
 
             markdown = self._post_process(markdown)
             return ProcessorOutput(markdown=markdown, metadata=metadata)
@@ -94,41 +105,126 @@ class CsvConverter(FormatConverter):
             logger.error(f"Error converting CSV {file_path}: {e}")
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _detect_encoding(self, raw_bytes: bytes) -> str:
-        if raw_bytes.startswith(b"\xef\xbb\xbf"):
+    def _detect_encoding(self, raw_bytes: Union[bytes, mmap.mmap]) -> str:
+        if raw_bytes[:3] == b"\xef\xbb\xbf":
             return "utf-8-sig"
-        result = chardet.detect(raw_bytes)
+        # Strict UTF-8 decode (also covers ASCII) is much cheaper than chardet
+        try:
+            str(raw_bytes, "utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+        # Import here: UTF-8 files (the common case) never need chardet
+        import chardet
+
+        # chardet only needs a sample to decide
+        result = chardet.detect(raw_bytes[: self._ENCODING_SAMPLE_BYTES])
         encoding = result.get("encoding", "utf-8")
         return (encoding or "utf-8").lower()
 
     def _detect_delimiter(self, content: str) -> str:
+        # Check first few lines only (without splitting the whole file)
+        end = -1
+        for _ in range(10):
+            end = content.find("\n", end + 1)
+            if end == -1:
+                break
+        sample = content if end == -1 else content[:end]
+
+        # Fast path: without quoting, exactly one candidate occurs the same
+        # number of times on every line. Anything else is left to csv.Sniffer.
+        lines = [line for line in sample.split("\n") if line.strip()]
+        if lines and '"' not in sample and "'" not in sample:
+            consistent = [
+                d
+                for d in self._DELIMITERS
+                if lines[0].count(d)
+                and all(line.count(d) == lines[0].count(d) for line in lines)
+            ]
+            if len(consistent) == 1:
+                return consistent[0]
+
         try:
-            # Check first few lines only
-            sample = "\n".join(content.split("\n")[:10])
             sniffer = csv.Sniffer()
-            dialect = sniffer.sniff(sample, delimiters=",;\t|")
+            dialect = sniffer.sniff(sample, delimiters=self._DELIMITERS)
             return dialect.delimiter
         except csv.Error:
             return ","
 
-    def _parse_csv(self, content: str, delimiter: str) -> pd.DataFrame:
+    def _parse_csv(
+        self, content: str, delimiter: str
+    ) -> Tuple[List[str], List[List[str]]]:
+        """
+        Parse CSV content into (headers, rows) of plain strings.
+
+        Blank lines are skipped and every row is padded or truncated to the
+        header width. Returns ([], []) if there is no header or parsing fails.
+        """
         try:
-            # Keep default na=False to avoid NaN strings, treat everything as object initially
-            return pd.read_csv(
-                io.StringIO(content),
-                delimiter=delimiter,
-                dtype=str,
-                keep_default_na=False,
+            records = (
+                row
+                for row in csv.reader(io.StringIO(content), delimiter=delimiter)
+                if row
             )
-        except Exception:
-            return pd.DataFrame()
+            header_row = next(records, None)
+            if header_row is None:
+                return [], []
+
+            headers = self._normalize_headers(header_row)
+            width = len(headers)
+            rows: List[List[str]] = []
+            for row in records:
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                elif len(row) > width:
+                    del row[width:]
+                rows.append(row)
+            return headers, rows
+        except csv.Error:
+            return [], []
+
+    def _normalize_headers(self, headers: List[str]) -> List[str]:
+        """Name empty headers "Unnamed: {i}" and suffix duplicates (a, a.1)."""
+        counts: Dict[str, int] = {}
+        result: List[str] = []
+        for i, header in enumerate(headers):
+            name = header or f"Unnamed: {i}"
+            count = counts.get(name, 0)
+            while count:
+                counts[name] = count + 1
+                name = f"{name}.{count}"
+                count = counts.get(name, 0)
+            counts[name] = count + 1
+            result.append(name)
+        return result
+
+    def _header_flags(self, header: str) -> Tuple[bool, bool, bool]:
+        """
+        Classify a header for smart formatting, once per column.
 
-    def _format_smart_value(self, header: str, value: str) -> str:
+        Returns:
+            (is_currency, is_percentage, is_identifier) keyword matches.
+        """
+        header_lower = str(header).lower()
+        return (
+            any(k in header_lower for k in self._CURRENCY_KEYWORDS),
+            "rate" in header_lower or "percent" in header_lower,
+            any(k in header_lower for k in self._IDENTIFIER_KEYWORDS),
+        )
+
+    def _format_smart_value(
+        self,
+        header: str,
+        value: str,
+        header_flags: Optional[Tuple[bool, bool, bool]] = None,
+    ) -> str:
         """
         Phase 4: Smart Number Formatting.
         Applies semantic formatting based on header keywords and value type.
         """
-        header_lower = header.lower()
+        if header_flags is None:
+            header_flags = self._header_flags(header)
+        is_currency, is_percentage, is_identifier = header_flags
 
         # 1. Clean strings
         value = value.strip()
@@ -146,16 +242,13 @@ class CsvConverter(FormatConverter):
 
         if is_number:
             # Currency Detection
-            if any(
-                k in header_lower
-                for k in ["revenue", "price", "cost", "salary", "usd", "amount"]
-            ):
+            if is_currency:
                 # If not already formatted with currency symbol
                 if not value.startswith("$") and not value.startswith("€"):
                     return f"${float_val:,.2f}"
 
             # Percentage Detection
-            if "rate" in header_lower or "percent" in header_lower:
+            if is_percentage:
                 if float_val < 1.0:  # Assumption: 0.45 -> 45%
                     return f"{float_val:.1%}"
                 return f"{float_val}%"
@@ -163,11 +256,7 @@ class CsvConverter(FormatConverter):
             # Large Numbers (Thousands separator)
             if float_val > 999:
                 # Check if it's an ID (usually doesn't need commas)
-                if (
-                    "id" not in header_lower
-                    and "code" not in header_lower
-                    and "year" not in header_lower
-                ):
+                if not is_identifier:
                     return (
                         f"{float_val:,.0f}"
                         if float_val.is_integer()
@@ -180,26 +269,23 @@ class CsvConverter(FormatConverter):
 
         return value
 
-    def _to_markdown_table(self, df: pd.DataFrame) -> str:
+    def _to_markdown_table(self, headers: List[str], rows: List[List[str]]) -> str:
         """Render small datasets as standard Markdown tables."""
-        if len(df.columns) == 0:
+        if not headers:
             return ""
 
         lines: List[str] = []
-        headers = list(df.columns)
 
         # Escape pipes in headers to prevent breaking markdown
-        safe_headers = [
-            str(h).replace("|", "&#124;").replace("\n", " ") for h in headers
-        ]
+        safe_headers = [h.replace("|", "&#124;").replace("\n", " ") for h in headers]
 
         lines.append("| " + " | ".join(safe_headers) + " |")
         lines.append("| " + " | ".join("---" for _ in headers) + " |")
 
-        for _, row in df.iterrows():
+        for row in rows:
             cells = []
             for v in row:
-                val = str(v).strip()
+                val = v.strip()
                 # Escape pipes and newlines
                 val = val.replace("|", "&#124;").replace("\n", "<br>")
                 cells.append(val)
@@ -207,32 +293,34 @@ class CsvConverter(FormatConverter):
 
         return "\n".join(lines)
 
-    def _to_sentence_format(self, df: pd.DataFrame) -> str:
+    def _to_sentence_format(self, headers: List[str], rows: List[List[str]]) -> str:
         """
         Phase 4: Sentence Serialization for large/wide tables.
         Format: "{Header} is {Value}."
         """
-        if df.empty:
+        if not rows:
             return ""
 
         lines: List[str] = []
-        headers = list(df.columns)
+        # Per column (once, not per cell): header, clean "{Header} is " prefix
+        # for sentence flow, and smart formatting flags
+        columns = [
+            (header, f"{header.strip()} is ", self._header_flags(header))
+            for header in headers
+        ]
 
-        for _, row in df.iterrows():
+        for row in rows:
             row_parts: List[str] = []
-            for header in headers:
-                raw_val = str(row[header])
+            for (header, prefix, header_flags), raw_val in zip(columns, row):
                 # Skip empty cells as per roadmap
                 if not raw_val or raw_val.strip() == "":
                     continue
 
                 # Apply smart formatting
-                formatted_val = self._format_smart_value(str(header), raw_val)
+                formatted_val = self._format_smart_value(header, raw_val, header_flags)
 
                 # Phase 4 Syntax: "{Header} is {Value}."
-                # Clean header and value for sentence flow
-                clean_header = str(header).strip()
-                row_parts.append(f"{clean_header} is {formatted_val}")
+                row_parts.append(prefix + formatted_val)
 
             if row_parts:
                 # Join parts with periods to create distinct statements or semi-colons
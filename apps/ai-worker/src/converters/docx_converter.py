@@ -2,8 +2,8 @@
 """DOCX converter using Docling."""
 
 import asyncio
-import gc
 from pathlib import Path
+from typing import Any, Optional
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -12,6 +12,10 @@ from .base import FormatConverter
 
 logger = get_logger(__name__)
 
+# Shared by all instances: the router creates a converter per request, and
+# building Docling's DocumentConverter is expensive
+_docling_converter: Optional[Any] = None
+
 
 class DocxConverter(FormatConverter):
     """
@@ -21,13 +25,11 @@ class DocxConverter(FormatConverter):
 
     category = "document"
 
-    def __init__(self):
-        self._converter = None
-
     def _get_docling_converter(self):
-        """Get or create cached Docling converter for DOCX."""
-        if self._converter is not None:
-            return self._converter
+        """Get or create the process-wide Docling converter for DOCX."""
+        global _docling_converter
+        if _docling_converter is not None:
+            return _docling_converter
 
         logger.info("creating_docx_converter")
 
@@ -53,13 +55,13 @@ class DocxConverter(FormatConverter):
 
         pdf_format_option = PdfFormatOption(pipeline_options=pipeline_options)
 
-        self._converter = DocumentConverter(
+        _docling_converter = DocumentConverter(
             allowed_formats=[InputFormat.DOCX],
             format_options={InputFormat.PDF: pdf_format_option},
         )
 
         logger.info("docx_converter_cached")
-        return self._converter
+        return _docling_converter
 
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """Convert DOCX to Markdown."""
@@ -98,6 +100,3 @@ class DocxConverter(FormatConverter):
         except Exception as e:
             logger.exception("docx_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
-
-        finally:
-            gc.collect()
@@ -1,12 +1,14 @@
 # apps/ai-worker/src/converters/epub_converter.py
-"""EPUB converter using ebooklib and BeautifulSoup."""
+"""EPUB converter reading the EPUB container directly with zipfile and lxml."""
 
+import asyncio
+import posixpath
+import zipfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
 
-import ebooklib
-from bs4 import BeautifulSoup, NavigableString, Tag
-from ebooklib import epub
+from lxml import etree
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -25,9 +27,51 @@ class EpubConverter(FormatConverter):
     category = "document"
     # Skip standard non-content files
     SKIP_ITEMS = {"toc", "nav", "cover", "ncx", "copyright", "title", "license"}
+    # Elements dropped from chapter HTML together with their content
+    STRIP_TAGS = {"script", "style", "meta", "link", "noscript"}
+
+    # Tag → (prefix, suffix) wrapped around an element's non-empty content
+    _TAG_MARKERS: Dict[str, Tuple[str, str]] = {
+        # Block-level transformations
+        "h1": ("\n\n# ", "\n\n"),
+        "h2": ("\n\n## ", "\n\n"),
+        "h3": ("\n\n### ", "\n\n"),
+        "h4": ("\n\n#### ", "\n\n"),
+        "h5": ("\n\n#### ", "\n\n"),
+        "h6": ("\n\n#### ", "\n\n"),
+        "p": ("\n\n", "\n\n"),
+        "li": ("\n- ", ""),
+        "ul": ("\n", "\n"),
+        "ol": ("\n", "\n"),
+        "blockquote": ("\n> ", "\n"),
+        "pre": ("\n```\n", "\n```\n"),
+        # Inline transformations
+        "b": ("**", "**"),
+        "strong": ("**", "**"),
+        "i": ("*", "*"),
+        "em": ("*", "*"),
+        "code": ("`", "`"),
+        # Table handling (simple text extraction for now, usually complex in EPUB)
+        "tr": ("\n", ""),
+        "td": (" ", " |"),
+        "th": (" ", " |"),
+    }
+
+    # EPUB container layout (OCF) and package document (OPF) namespaces
+    _CONTAINER_PATH = "META-INF/container.xml"
+    _NAMESPACES = {
+        "container": "urn:oasis:names:tc:opendocument:xmlns:container",
+        "opf": "http://www.idpf.org/2007/opf",
+        "dc": "http://purl.org/dc/elements/1.1/",
+    }
 
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """Convert EPUB to Markdown preserving structure."""
+        # Parsing and the tree walk are blocking; keep the event loop free
+        return await asyncio.to_thread(self._to_markdown_sync, file_path)
+
+    def _to_markdown_sync(self, file_path: str) -> ProcessorOutput:
+        """Blocking EPUB to Markdown conversion, run in a worker thread."""
         try:
             path = Path(file_path)
             if not path.exists():
@@ -35,37 +79,39 @@ class EpubConverter(FormatConverter):
                     markdown="", metadata={"error": f"File not found: {file_path}"}
                 )
 
-            # Ebooklib can be chatty, suppress warnings if needed
-            book = epub.read_epub(str(path))
             chapters: List[str] = []
 
-            # Extract book metadata
-            book_title = self._get_metadata(book, "title")
-            author = self._get_metadata(book, "creator")
+            # Only the package document and chapter files are read; images,
+            # fonts and styles are never loaded from the archive
+            with zipfile.ZipFile(path) as archive:
+                opf_path = self._get_package_path(archive)
+                package = self._parse_xml(archive.read(opf_path))
+                opf_dir = posixpath.dirname(opf_path)
 
-            # Iterate through items (Phase 4: Split by chapter markers)
-            for item in book.get_items():
-                if item.get_type() != ebooklib.ITEM_DOCUMENT:
-                    continue
+                # Extract book metadata
+                book_title = self._get_metadata(package, "title")
+                author = self._get_metadata(package, "creator")
 
-                # Filter out utility files based on name
-                item_name = (item.get_name() or "").lower()
-                if any(skip in item_name for skip in self.SKIP_ITEMS):
-                    continue
+                # Iterate through chapters (Phase 4: Split by chapter markers)
+                for item_name in self._iter_document_names(package):
+                    # Filter out utility files based on name
+                    if any(skip in item_name.lower() for skip in self.SKIP_ITEMS):
+                        continue
 
-                content = item.get_content().decode("utf-8", errors="replace")
+                    item_path = posixpath.normpath(posixpath.join(opf_dir, item_name))
+                    content = archive.read(item_path).decode("utf-8", errors="replace")
 
-                # Convert HTML content to Markdown
-                # This ensures H1/H2 tags become #/## for the splitter
-                chapter_md = self._html_to_markdown(content)
+                    # Convert HTML content to Markdown
+                    # This ensures H1/H2 tags become #/## for the splitter
+                    chapter_md = self._html_to_markdown(content)
 
-                # Sanitize using base logic (Phase 4: Input Sanitization)
-                chapter_md = self._sanitize_raw(chapter_md)
+                    # Sanitize using base logic (Phase 4: Input Sanitization)
+                    chapter_md = self._sanitize_raw(chapter_md)
 
-                if not chapter_md.strip():
-                    continue
+                    if not chapter_md.strip():
+                        continue
 
-                chapters.append(chapter_md)
+                    chapters.append(chapter_md)
 
             if not chapters:
                 return ProcessorOutput(
@@ -95,11 +141,37 @@ class EpubConverter(FormatConverter):
             logger.exception("epub_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _get_metadata(self, book: epub.EpubBook, key: str) -> Optional[str]:
+    @staticmethod
+    def _parse_xml(data: bytes) -> Any:
+        return etree.fromstring(
+            data, etree.XMLParser(resolve_entities=False, no_network=True)
+        )
+
+    def _get_package_path(self, archive: zipfile.ZipFile) -> str:
+        """Path of the OPF package document, from META-INF/container.xml."""
+        container = self._parse_xml(archive.read(self._CONTAINER_PATH))
+        rootfile = container.find(".//container:rootfile", self._NAMESPACES)
+        if rootfile is None or not rootfile.get("full-path"):
+            raise ValueError("EPUB container has no package document")
+        return rootfile.get("full-path")
+
+    def _iter_document_names(self, package: Any) -> Iterator[str]:
+        """Yield XHTML manifest entries (relative to the OPF) in manifest order."""
+        for item in package.iterfind("opf:manifest/opf:item", self._NAMESPACES):
+            if item.get("media-type") != "application/xhtml+xml":
+                continue
+            # Cover pages are skipped whatever their file name
+            if "cover" in item.get("properties", "").split():
+                continue
+            href = item.get("href")
+            if href:
+                yield unquote(href)
+
+    def _get_metadata(self, package: Any, key: str) -> Optional[str]:
         try:
-            data = book.get_metadata("DC", key)
-            if data and len(data) > 0:
-                return data[0][0]
+            element = package.find(f"opf:metadata/dc:{key}", self._NAMESPACES)
+            if element is not None:
+                return element.text
         except Exception:
             pass
         return None
@@ -109,88 +181,79 @@ class EpubConverter(FormatConverter):
         Parses HTML and converts semantic tags to Markdown.
         We do this manually to avoid extra dependencies (like markdownify)
         and to strictly control the output for RAG optimization.
+
+        The tree is walked iteratively: each open element collects the
+        Markdown of its finished children, which is joined once when the
+        element closes. No recursion, so deeply nested chapters are safe.
         """
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Remove script and style elements
-        for script in soup(["script", "style", "meta", "link", "noscript"]):
-            script.decompose()
-
-        # Focus on body, or full soup if no body
-        root = soup.body or soup
-
-        # Recursive function to process tags
-        def process_element(element):
-            if isinstance(element, NavigableString):
-                text = str(element).strip()
-                if text:
-                    return text
-                return ""
-
-            if isinstance(element, Tag):
-                content = ""
-
-                # Process children first
-                for child in element.children:
-                    child_md = process_element(child)
-                    if child_md:
-                        # Add space between inline elements if needed
-                        if (
-                            content
-                            and not content.endswith(" ")
-                            and not child_md.startswith(" ")
-                        ):
-                            content += " " + child_md
-                        else:
-                            content += child_md
-
-                content = content.strip()
-                if not content:
-                    return ""
-
-                # Block-level transformations
-                if element.name in ["h1"]:
-                    return f"\n\n# {content}\n\n"
-                elif element.name in ["h2"]:
-                    return f"\n\n## {content}\n\n"
-                elif element.name in ["h3"]:
-                    return f"\n\n### {content}\n\n"
-                elif element.name in ["h4", "h5", "h6"]:
-                    return f"\n\n#### {content}\n\n"
-                elif element.name == "p":
-                    return f"\n\n{content}\n\n"
-                elif element.name == "br":
-                    return "\n"
-                elif element.name == "li":
-                    return f"\n- {content}"
-                elif element.name in ["ul", "ol"]:
-                    return f"\n{content}\n"
-                elif element.name == "blockquote":
-                    return f"\n> {content}\n"
-                elif element.name == "pre":
-                    return f"\n```\n{content}\n```\n"
-
-                # Inline transformations
-                elif element.name in ["b", "strong"]:
-                    return f"**{content}**"
-                elif element.name in ["i", "em"]:
-                    return f"*{content}*"
-                elif element.name == "code":
-                    return f"`{content}`"
-                elif element.name == "a":
-                    href = element.get("href", "")
-                    return f"[{content}]({href})" if href else content
-
-                # Table handling (simple text extraction for now, usually complex in EPUB)
-                elif element.name in ["tr"]:
-                    return f"\n{content}"
-                elif element.name in ["td", "th"]:
-                    return f" {content} |"
-
-                # Return content as-is for divs, spans, etc.
-                return content
+        # Encode so lxml accepts the XHTML <?xml ... encoding?> declaration
+        root = etree.fromstring(
+            html_content.encode("utf-8"),
+            etree.HTMLParser(encoding="utf-8", huge_tree=True),
+        )
+        if root is None:
+            return ""
 
+        # Focus on body, or full document if no body
+        body = root.find("body")
+        if body is not None:
+            root = body
+
+        # Markdown parts of each open element, innermost last
+        stack: List[List[str]] = [[]]
+        walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+        for event, element in walker:
+            if event == "start":
+                if element.tag in self.STRIP_TAGS:
+                    # Drop script/style content, keep the text after it
+                    walker.skip_subtree()
+                else:
+                    stack.append([])
+                    self._append_text(stack[-1], element.text)
+                continue
+
+            if event == "end" and element.tag not in self.STRIP_TAGS:
+                parts = stack.pop()
+                element_md = self._element_to_markdown(element, parts)
+                if element_md:
+                    stack[-1].append(element_md)
+
+            # Comments and processing instructions only contribute their tail
+            if element is not root:
+                self._append_text(stack[-1], element.tail)
+
+        return "".join(stack[0])
+
+    @staticmethod
+    def _append_text(parts: List[str], text: Optional[str]) -> None:
+        if text:
+            text = text.strip()
+            if text:
+                parts.append(text)
+
+    def _element_to_markdown(self, element: Any, parts: List[str]) -> str:
+        """Join an element's child parts and apply its Markdown markers."""
+        # Add space between inline elements if needed
+        pieces: List[str] = []
+        for part in parts:
+            if pieces and not pieces[-1].endswith(" ") and not part.startswith(" "):
+                pieces.append(" ")
+            pieces.append(part)
+
+        content = "".join(pieces).strip()
+        if not content:
             return ""
 
-        # Process the root
-        return process_element(root)
+        tag = element.tag
+        markers = self._TAG_MARKERS.get(tag)
+        if markers is not None:
+            return markers[0] + content + markers[1]
+
+        if tag == "br":
+            return "\n"
+        elif tag == "a":
+            href = element.get("href", "")
+            return f"[{content}]({href})" if href else content
+
+        # Return content as-is for divs, spans, etc.
+        return content
@@ -1,10 +1,11 @@
 # apps/ai-worker/src/converters/html_converter.py
-"""HTML converter using BeautifulSoup."""
+"""HTML converter using lxml."""
 
+import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, NavigableString, Tag, Comment
+from lxml import etree
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -38,8 +39,51 @@ class HtmlConverter(FormatConverter):
         "header",  # Often contains site-wide nav, safe to remove for RAG focus
     ]
 
+    # Tag → (prefix, suffix) wrapped around an element's non-empty content.
+    # One dict lookup per element instead of an if/elif chain.
+    _TAG_MARKERS: Dict[str, Tuple[str, str]] = {
+        # --- Block-level Transformations ---
+        # Headers (Critical for Phase 4 Chunking)
+        "h1": ("\n\n# ", "\n\n"),
+        "h2": ("\n\n## ", "\n\n"),
+        "h3": ("\n\n### ", "\n\n"),
+        "h4": ("\n\n#### ", "\n\n"),
+        "h5": ("\n\n#### ", "\n\n"),
+        "h6": ("\n\n#### ", "\n\n"),
+        # Paragraphs
+        "p": ("\n\n", "\n\n"),
+        # Semantic Layout (Phase 4 Requirement)
+        # Treat articles and sections as distinct blocks
+        "section": ("\n\n", "\n\n"),
+        "article": ("\n\n", "\n\n"),
+        "main": ("\n\n", "\n\n"),
+        "div": ("\n\n", "\n\n"),
+        # Lists
+        "li": ("\n- ", ""),
+        "ul": ("\n", "\n"),
+        "ol": ("\n", "\n"),
+        # Quotes & Code
+        "blockquote": ("\n> ", "\n"),
+        "pre": ("\n```\n", "\n```\n"),
+        # --- Inline Transformations ---
+        "b": ("**", "**"),
+        "strong": ("**", "**"),
+        "i": ("*", "*"),
+        "em": ("*", "*"),
+        "code": ("`", "`"),
+        # Tables (Simple text extraction)
+        "tr": ("\n", ""),
+        "td": (" ", " |"),
+        "th": (" ", " |"),
+    }
+
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
-        """Convert HTML to Markdown using custom recursive parser."""
+        """Convert HTML to Markdown using a single iterative tree walk."""
+        # Parsing and the tree walk are blocking; keep the event loop free
+        return await asyncio.to_thread(self._to_markdown_sync, file_path)
+
+    def _to_markdown_sync(self, file_path: str) -> ProcessorOutput:
+        """Blocking HTML to Markdown conversion, run in a worker thread."""
         try:
             path = Path(file_path)
             if not path.exists():
@@ -48,7 +92,8 @@ class HtmlConverter(FormatConverter):
                 )
 
             # Read file
-            content = path.read_text(encoding="utf-8", errors="replace")
+            with self._open_mapped(path) as raw_bytes:
+                content = str(raw_bytes, "utf-8", errors="replace")
 
             # Phase 4: Input Sanitization
             content = self._sanitize_raw(content)
@@ -56,21 +101,24 @@ class HtmlConverter(FormatConverter):
             if not content.strip():
                 return ProcessorOutput(markdown="", metadata={})
 
-            soup = BeautifulSoup(content, "lxml")
-
-            # 1. Extract Metadata BEFORE cleaning tags (title might be in head)
-            title = self._get_title(soup)
-            description = self._get_meta_description(soup)
+            # Encode so lxml accepts a leading <?xml ... encoding?> declaration
+            root = etree.fromstring(
+                content.encode("utf-8"),
+                etree.HTMLParser(encoding="utf-8", huge_tree=True),
+            )
+            if root is None:
+                return ProcessorOutput(markdown="", metadata={})
 
-            # 2. Clean Noise
-            self._clean_soup(soup)
+            # 1. Extract Metadata (title might be in head)
+            title = self._get_title(root)
+            description = self._get_meta_description(root)
 
-            # 3. Convert to Markdown
-            # Use body if available, otherwise full soup
-            root_element = soup.body or soup
-            markdown = self._html_to_markdown(root_element)
+            # 2. Convert to Markdown, skipping noise tags and comments
+            # Use body if available, otherwise full document
+            body = root.find("body")
+            markdown = self._html_to_markdown(body if body is not None else root)
 
-            # 4. Post-process
+            # 3. Post-process
             markdown = self._post_process(markdown)
 
             logger.info("html_conversion_complete", path=file_path, chars=len(markdown))
@@ -87,118 +135,83 @@ class HtmlConverter(FormatConverter):
             logger.exception("html_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _get_title(self, soup: BeautifulSoup) -> Optional[str]:
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+    def _get_title(self, root: Any) -> Optional[str]:
+        title = root.find(".//title")
+        if title is not None and title.text:
+            return title.text.strip()
         return None
 
-    def _get_meta_description(self, soup: BeautifulSoup) -> Optional[str]:
-        meta = soup.find("meta", attrs={"name": "description"})
-        if meta and meta.get("content"):
-            return meta["content"].strip()
+    def _get_meta_description(self, root: Any) -> Optional[str]:
+        meta = root.find(".//meta[@name='description']")
+        if meta is not None and meta.get("content"):
+            return meta.get("content").strip()
         return None
 
-    def _clean_soup(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted tags and comments."""
-        # Remove tags
-        for tag in self.REMOVE_TAGS:
-            for element in soup.find_all(tag):
-                element.decompose()
-
-        # Remove comments
-        for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
-            comment.extract()
-
-    def _html_to_markdown(self, root_element: Tag) -> str:
+    def _html_to_markdown(self, root_element: Any) -> str:
         """
-        Recursively converts HTML to Markdown.
+        Iteratively converts HTML to Markdown.
         Ensures consistent handling of headers and semantics for RAG.
-        """
-
-        def process_element(element):
-            if isinstance(element, NavigableString):
-                text = str(element).strip()
-                if text:
-                    return text
-                return ""
-
-            if isinstance(element, Tag):
-                content = ""
-
-                # Process children
-                for child in element.children:
-                    child_md = process_element(child)
-                    if child_md:
-                        # Add space logic for inline elements
-                        if (
-                            content
-                            and not content.endswith(" ")
-                            and not child_md.startswith(" ")
-                        ):
-                            content += " " + child_md
-                        else:
-                            content += child_md
-
-                content = content.strip()
-                if not content:
-                    return ""
-
-                # --- Block-level Transformations ---
-
-                # Headers (Critical for Phase 4 Chunking)
-                if element.name == "h1":
-                    return f"\n\n# {content}\n\n"
-                elif element.name == "h2":
-                    return f"\n\n## {content}\n\n"
-                elif element.name == "h3":
-                    return f"\n\n### {content}\n\n"
-                elif element.name in ["h4", "h5", "h6"]:
-                    return f"\n\n#### {content}\n\n"
-
-                # Paragraphs and Breaks
-                elif element.name == "p":
-                    return f"\n\n{content}\n\n"
-                elif element.name == "br":
-                    return "\n"
-                elif element.name == "hr":
-                    return "\n\n---\n\n"
-
-                # Semantic Layout (Phase 4 Requirement)
-                # Treat articles and sections as distinct blocks
-                elif element.name in ["section", "article", "main", "div"]:
-                    return f"\n\n{content}\n\n"
-
-                # Lists
-                elif element.name == "li":
-                    return f"\n- {content}"
-                elif element.name in ["ul", "ol"]:
-                    return f"\n{content}\n"
-
-                # Quotes & Code
-                elif element.name == "blockquote":
-                    return f"\n> {content}\n"
-                elif element.name == "pre":
-                    return f"\n```\n{content}\n```\n"
-
-                # --- Inline Transformations ---
-                elif element.name in ["b", "strong"]:
-                    return f"**{content}**"
-                elif element.name in ["i", "em"]:
-                    return f"*{content}*"
-                elif element.name == "code":
-                    return f"`{content}`"
-                elif element.name == "a":
-                    href = element.get("href", "")
-                    return f"[{content}]({href})" if href else content
-
-                # Tables (Simple text extraction)
-                elif element.name == "tr":
-                    return f"\n{content}"
-                elif element.name in ["td", "th"]:
-                    return f" {content} |"
-
-                return content
 
+        REMOVE_TAGS subtrees and comments are skipped (their tail text is
+        kept). Each open element collects its children's Markdown, joined
+        once when it closes.
+        """
+        remove_tags = set(self.REMOVE_TAGS)
+        # Markdown parts of each open element, innermost last
+        stack: List[List[str]] = [[]]
+        walker = etree.iterwalk(root_element, events=("start", "end", "comment", "pi"))
+        for event, element in walker:
+            if event == "start":
+                if element.tag in remove_tags:
+                    walker.skip_subtree()
+                else:
+                    stack.append([])
+                    self._append_text(stack[-1], element.text)
+                continue
+
+            if event == "end" and element.tag not in remove_tags:
+                parts = stack.pop()
+                element_md = self._element_to_markdown(element, parts)
+                if element_md:
+                    stack[-1].append(element_md)
+
+            if element is not root_element:
+                self._append_text(stack[-1], element.tail)
+
+        return "".join(stack[0])
+
+    @staticmethod
+    def _append_text(parts: List[str], text: Optional[str]) -> None:
+        if text:
+            text = text.strip()
+            if text:
+                parts.append(text)
+
+    def _element_to_markdown(self, element: Any, parts: List[str]) -> str:
+        """Join an element's child parts and apply its Markdown markers."""
+        # Add space logic for inline elements
+        pieces: List[str] = []
+        for part in parts:
+            if pieces and not pieces[-1].endswith(" ") and not part.startswith(" "):
+                pieces.append(" ")
+            pieces.append(part)
+
+        content = "".join(pieces).strip()
+        if not content:
             return ""
 
-        return process_element(root_element)
+        tag = element.tag
+        markers = self._TAG_MARKERS.get(tag)
+        if markers is not None:
+            return markers[0] + content + markers[1]
+
+        # Breaks
+        if tag == "br":
+            return "\n"
+        elif tag == "hr":
+            return "\n\n---\n\n"
+        elif tag == "a":
+            href = element.get("href", "")
+            return f"[{content}]({href})" if href else content
+
+        return content
@@ -2,10 +2,11 @@
 """JSON file converter with tabular detection."""
 
 import json
+import mmap
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
-import chardet
+import orjson
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -24,6 +25,9 @@ class JsonConverter(FormatConverter):
 
     category = "tabular"
 
+    # Bytes handed to chardet when the file is not valid UTF-8
+    _ENCODING_SAMPLE_BYTES = 64 * 1024
+
     async def to_markdown(
         self, file_path: str, file_format: str = "json"
     ) -> ProcessorOutput:
@@ -38,9 +42,9 @@ class JsonConverter(FormatConverter):
 
         try:
             # 1. Read with encoding detection
-            raw_bytes = path.read_bytes()
-            encoding = self._detect_encoding(raw_bytes)
-            content = raw_bytes.decode(encoding, errors="replace")
+            with self._open_mapped(path) as raw_bytes:
+                encoding = self._detect_encoding(raw_bytes)
+                content = str(raw_bytes, encoding, errors="replace")
             content = self._sanitize_raw(content)
 
             # 2. Parse and convert
@@ -59,30 +63,49 @@ class JsonConverter(FormatConverter):
             logger.exception("json_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _detect_encoding(self, raw_bytes: bytes) -> str:
+    def _detect_encoding(self, raw_bytes: Union[bytes, mmap.mmap]) -> str:
         """Detect file encoding with BOM check."""
-        if raw_bytes.startswith(b"\xef\xbb\xbf"):
+        if raw_bytes[:3] == b"\xef\xbb\xbf":
             return "utf-8-sig"
-        result = chardet.detect(raw_bytes)
+        # Strict UTF-8 decode (also covers ASCII) is much cheaper than chardet
+        try:
+            str(raw_bytes, "utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+        # Import here: UTF-8 files (the common case) never need chardet
+        import chardet
+
+        # chardet only needs a sample to decide
+        result = chardet.detect(raw_bytes[: self._ENCODING_SAMPLE_BYTES])
         encoding = result.get("encoding", "utf-8")
         return (encoding or "utf-8").lower()
 
     def _json_to_markdown(self, content: str, filename: str) -> str:
         """Convert JSON content to Markdown."""
         try:
-            parsed = json.loads(content)
-
-            # Check if it's tabular (list of objects)
-            if self._is_tabular_json(parsed):
-                return self._json_array_to_sentences(parsed, filename)
-
-            # Fallback: pretty-print as code block
+            parsed = orjson.loads(content)
+            parsed_by_orjson = True
+        except orjson.JSONDecodeError:
+            try:
+                # orjson rejects NaN/Infinity and lone surrogates, which
+                # stdlib json accepts
+                parsed = json.loads(content)
+                parsed_by_orjson = False
+            except json.JSONDecodeError:
+                # Invalid JSON → treat as text
+                return f"# {filename}\n\n```\n{content}\n```"
+
+        # Check if it's tabular (list of objects)
+        if self._is_tabular_json(parsed):
+            return self._json_array_to_sentences(parsed, filename)
+
+        # Fallback: pretty-print as code block
+        if parsed_by_orjson:
+            pretty = orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
             pretty = json.dumps(parsed, indent=2, ensure_ascii=False)
-            return f"# {filename}\n\n```json\n{pretty}\n```"
-
-        except json.JSONDecodeError:
-            # Invalid JSON → treat as text
-            return f"# {filename}\n\n```\n{content}\n```"
+        return f"# {filename}\n\n```json\n{pretty}\n```"
 
     def _is_tabular_json(self, data: Any) -> bool:
         """Check if JSON is a list of flat dictionaries (tabular structure)."""
@@ -97,14 +120,21 @@ class JsonConverter(FormatConverter):
         Format: "{Key} is {Value}. {Key} is {Value}."
         """
         lines = [f"# {filename} (Data)"]
+        # Keys repeat on every row; title-case each one once
+        clean_keys: Dict[Any, str] = {}
 
         for item in data:
             row_parts = []
             for key, value in item.items():
-                if value is None or str(value).strip() == "":
+                if value is None:
+                    continue
+                clean_val = str(value).strip()
+                if not clean_val:
                     continue
-                clean_key = str(key).replace("_", " ").title()
-                clean_val = str(value).strip().replace("\n", " ")
+                clean_key = clean_keys.get(key)
+                if clean_key is None:
+                    clean_key = clean_keys[key] = str(key).replace("_", " ").title()
+                clean_val = clean_val.replace("\n", " ")
                 row_parts.append(f"{clean_key} is {clean_val}")
 
             if row_parts:
@@ -2,9 +2,8 @@
 """PDF converter using Docling."""
 
 import asyncio
-import gc
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from src.config import settings
 from src.logging_config import get_logger
@@ -14,6 +13,10 @@ from .base import FormatConverter
 
 logger = get_logger(__name__)
 
+# Docling converters by OCR mode and thread count, shared by all instances
+# (the router creates a converter per request; building one is expensive)
+_converters: Dict[str, Any] = {}
+
 
 class DoclingPdfConverter(FormatConverter):
     """
@@ -24,14 +27,11 @@ class DoclingPdfConverter(FormatConverter):
 
     category = "document"
 
-    def __init__(self):
-        self._converters: Dict[str, Any] = {}  # Cache by OCR mode
-
     def _get_docling_converter(self, ocr_mode: str, num_threads: int = 4):
         """Get or create cached Docling converter for the OCR mode and thread count."""
         cache_key = f"{ocr_mode}_{num_threads}"
-        if cache_key in self._converters:
-            return self._converters[cache_key]
+        if cache_key in _converters:
+            return _converters[cache_key]
 
         logger.info("creating_converter", ocr_mode=ocr_mode, num_threads=num_threads)
 
@@ -91,11 +91,23 @@ class DoclingPdfConverter(FormatConverter):
             format_options={InputFormat.PDF: pdf_format_option},
         )
 
-        self._converters[cache_key] = converter
+        _converters[cache_key] = converter
         logger.info("converter_cached", ocr_mode=ocr_mode, num_threads=num_threads)
 
         return converter
 
+    def warmup(self, ocr_modes: Iterable[str], num_threads: int = 4) -> None:
+        """
+        Build converters and load their PDF pipeline models ahead of the first
+        request. Blocking; run it in a worker thread.
+        """
+        from docling.datamodel.base_models import InputFormat
+
+        for ocr_mode in ocr_modes:
+            converter = self._get_docling_converter(ocr_mode, num_threads)
+            converter.initialize_pipeline(InputFormat.PDF)
+            logger.info("converter_warmed", ocr_mode=ocr_mode, num_threads=num_threads)
+
     async def to_markdown(
         self, file_path: str, ocr_mode: str = "auto", num_threads: int = 4
     ) -> ProcessorOutput:
@@ -128,15 +140,15 @@ class DoclingPdfConverter(FormatConverter):
             converter = self._get_docling_converter(ocr_mode, num_threads)
             result = await asyncio.to_thread(converter.convert, str(path))
 
-            markdown = result.document.export_to_markdown()
-            markdown = self._sanitize_raw(markdown)
+            raw_markdown = result.document.export_to_markdown()
+            markdown = self._sanitize_raw(raw_markdown)
             markdown = self._post_process_pdf(markdown)
             page_count = (
                 len(result.document.pages) if hasattr(result.document, "pages") else 1
             )
 
             ocr_applied = ocr_mode == "force" or (
-                ocr_mode == "auto" and self._needs_ocr(result)
+                ocr_mode == "auto" and self._needs_ocr(result, raw_markdown)
             )
 
             logger.info(
@@ -156,10 +168,10 @@ class DoclingPdfConverter(FormatConverter):
             logger.exception("pdf_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-        finally:
-            gc.collect()
-
     def _is_password_protected(self, path: Path) -> bool:
+        # Skip opening the document when the trailer has no /Encrypt entry
+        if not self._pdf_may_be_encrypted(path):
+            return False
         try:
             import fitz
 
@@ -168,9 +180,9 @@ class DoclingPdfConverter(FormatConverter):
         except Exception:
             return False
 
-    def _needs_ocr(self, result) -> bool:
+    def _needs_ocr(self, result, text: str) -> bool:
+        """Low text density (from the raw Markdown export) suggests a scan."""
         try:
-            text = result.document.export_to_markdown()
             pages = result.document.pages if hasattr(result.document, "pages") else []
             chars_per_page = len(text) / max(1, len(pages))
             return chars_per_page < 50
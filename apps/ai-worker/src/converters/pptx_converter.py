@@ -2,10 +2,9 @@
 """PowerPoint PPTX converter using Docling."""
 
 import asyncio
-import gc
 import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -17,6 +16,10 @@ logger = get_logger(__name__)
 # Standard slide marker for presentation chunking
 SLIDE_MARKER = "<!-- slide -->"
 
+# Shared by all instances: the router creates a converter per request, and
+# building Docling's DocumentConverter is expensive
+_docling_converter: Optional[Any] = None
+
 
 class PptxConverter(FormatConverter):
     """
@@ -26,23 +29,26 @@ class PptxConverter(FormatConverter):
 
     category = "presentation"
 
-    def __init__(self):
-        self._converter = None
+    # Docling separates slides with a '---' rule on its own line
+    _RULE_PATTERN = re.compile(r"\n\s*---\s*\n")
+    # H1 lines ("# Title", not "## ..."), used when there are no rules
+    _H1_PATTERN = re.compile(r"^# ", re.MULTILINE)
 
     def _get_docling_converter(self):
-        """Get or create Docling converter for PPTX."""
-        if self._converter is not None:
-            return self._converter
+        """Get or create the process-wide Docling converter for PPTX."""
+        global _docling_converter
+        if _docling_converter is not None:
+            return _docling_converter
 
         from docling.datamodel.base_models import InputFormat
         from docling.document_converter import DocumentConverter
 
         # Note: PPTX converter in Docling doesn't use TableStructureModel
         # so GPU issues are less likely. But we log for monitoring.
-        self._converter = DocumentConverter(allowed_formats=[InputFormat.PPTX])
+        _docling_converter = DocumentConverter(allowed_formats=[InputFormat.PPTX])
         logger.info("pptx_converter_created")
 
-        return self._converter
+        return _docling_converter
 
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """Convert PPTX to Markdown with slide markers."""
@@ -95,9 +101,6 @@ class PptxConverter(FormatConverter):
             logger.exception("pptx_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-        finally:
-            gc.collect()
-
     def _extract_metadata(self, doc_obj: Any) -> Dict[str, Any]:
         """Extract title/author from Docling document object if available."""
         metadata = {}
@@ -124,24 +127,20 @@ class PptxConverter(FormatConverter):
         # Strategy A: Replace Horizontal Rules (---)
         # Docling typically separates pages/slides with ---
         # We look for --- surrounded by newlines
-        if re.search(r"\n\s*---\s*\n", markdown):
-            return re.sub(r"\n\s*---\s*\n", f"\n\n{SLIDE_MARKER}\n\n", markdown)
+        if self._RULE_PATTERN.search(markdown):
+            return self._RULE_PATTERN.sub(f"\n\n{SLIDE_MARKER}\n\n", markdown)
 
         # Strategy B: Fallback to H1 Headers
         # Only if no --- found (e.g., custom template)
         logger.warning(
             "pptx_fallback_marker", msg="No '---' delimiters found, using H1 heuristic"
         )
-        lines = markdown.split("\n")
-        result: list[str] = []
-        first_heading_found = False
-
-        for line in lines:
-            # Detect H1 but exclude H2, H3...
-            if line.startswith("# ") and not line.startswith("##"):
-                if first_heading_found:
-                    result.append(f"\n{SLIDE_MARKER}\n")
-                first_heading_found = True
-            result.append(line)
-
-        return "\n".join(result)
+        # Every H1 after the first one starts a new slide
+        first_heading = self._H1_PATTERN.search(markdown)
+        if first_heading is None:
+            return markdown
+
+        # Split inside the first "# " so the rest cannot match at its start
+        split_at = first_heading.start() + 1
+        head, rest = markdown[:split_at], markdown[split_at:]
+        return head + self._H1_PATTERN.sub(f"\n{SLIDE_MARKER}\n\n# ", rest)
@@ -1,7 +1,6 @@
 # apps/ai-worker/src/converters/pymupdf_converter.py
 """Fast PDF converter using PyMuPDF4LLM."""
 
-import gc
 import re
 from pathlib import Path
 
@@ -75,11 +74,11 @@ class PyMuPDFConverter(FormatConverter):
             logger.exception("pymupdf_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-        finally:
-            gc.collect()
-
     def _is_password_protected(self, path: Path) -> bool:
         """Check if PDF is password protected."""
+        # Skip opening the document when the trailer has no /Encrypt entry
+        if not self._pdf_may_be_encrypted(path):
+            return False
         try:
             import fitz
 
@@ -1,9 +1,9 @@
 # apps/ai-worker/src/converters/txt_converter.py
 """Plain text file converter."""
 
+import mmap
 from pathlib import Path
-
-import chardet
+from typing import Union
 
 from src.logging_config import get_logger
 from src.models import ProcessorOutput
@@ -21,6 +21,9 @@ class TxtConverter(FormatConverter):
 
     category = "document"
 
+    # Bytes handed to chardet when the file is not valid UTF-8
+    _ENCODING_SAMPLE_BYTES = 64 * 1024
+
     async def to_markdown(
         self, file_path: str, file_format: str = "txt"
     ) -> ProcessorOutput:
@@ -35,9 +38,9 @@ class TxtConverter(FormatConverter):
 
         try:
             # 1. Robust reading with encoding detection
-            raw_bytes = path.read_bytes()
-            encoding = self._detect_encoding(raw_bytes)
-            content = raw_bytes.decode(encoding, errors="replace")
+            with self._open_mapped(path) as raw_bytes:
+                encoding = self._detect_encoding(raw_bytes)
+                content = str(raw_bytes, encoding, errors="replace")
 
             # 2. Sanitize
             content = self._sanitize_raw(content)
@@ -58,10 +61,20 @@ class TxtConverter(FormatConverter):
             logger.exception("txt_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _detect_encoding(self, raw_bytes: bytes) -> str:
+    def _detect_encoding(self, raw_bytes: Union[bytes, mmap.mmap]) -> str:
         """Detect file encoding with BOM check."""
-        if raw_bytes.startswith(b"\xef\xbb\xbf"):
+        if raw_bytes[:3] == b"\xef\xbb\xbf":
             return "utf-8-sig"
-        result = chardet.detect(raw_bytes)
+        # Strict UTF-8 decode (also covers ASCII) is much cheaper than chardet
+        try:
+            str(raw_bytes, "utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+        # Import here: UTF-8 files (the common case) never need chardet
+        import chardet
+
+        # chardet only needs a sample to decide
+        result = chardet.detect(raw_bytes[: self._ENCODING_SAMPLE_BYTES])
         encoding = result.get("encoding", "utf-8")
         return (encoding or "utf-8").lower()
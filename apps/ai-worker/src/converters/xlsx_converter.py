@@ -1,8 +1,9 @@
 # apps/ai-worker/src/converters/xlsx_converter.py
 """Excel XLSX converter using openpyxl and pandas."""
 
+import asyncio
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -23,6 +24,10 @@ class XlsxConverter(FormatConverter):
 
     category = "tabular"
 
+    # Header keywords for Phase 4 smart number formatting
+    _CURRENCY_KEYWORDS = ("revenue", "price", "cost", "salary", "usd", "amount")
+    _IDENTIFIER_KEYWORDS = ("id", "code", "year")  # No thousands separator
+
     def __init__(self, max_table_rows: int = 35, max_table_cols: int = 20):
         """Initialize converter with configurable table size thresholds."""
         self.max_table_rows = max_table_rows
@@ -30,6 +35,11 @@ class XlsxConverter(FormatConverter):
 
     async def to_markdown(self, file_path: str) -> ProcessorOutput:
         """Convert XLSX to Markdown."""
+        # Reading, parsing and formatting are blocking; keep the event loop free
+        return await asyncio.to_thread(self._to_markdown_sync, file_path)
+
+    def _to_markdown_sync(self, file_path: str) -> ProcessorOutput:
+        """Blocking XLSX to Markdown conversion, run in a worker thread."""
         try:
             path = Path(file_path)
             if not path.exists():
@@ -113,13 +123,34 @@ class XlsxConverter(FormatConverter):
             logger.exception("xlsx_conversion_error", path=file_path, error=str(e))
             return ProcessorOutput(markdown="", metadata={"error": str(e)})
 
-    def _format_smart_value(self, header: str, value: str) -> str:
+    def _header_flags(self, header: str) -> Tuple[bool, bool, bool]:
+        """
+        Classify a header for smart formatting, once per column.
+
+        Returns:
+            (is_currency, is_percentage, is_identifier) keyword matches.
+        """
+        header_lower = str(header).lower()
+        return (
+            any(k in header_lower for k in self._CURRENCY_KEYWORDS),
+            "rate" in header_lower or "percent" in header_lower,
+            any(k in header_lower for k in self._IDENTIFIER_KEYWORDS),
+        )
+
+    def _format_smart_value(
+        self,
+        header: str,
+        value: str,
+        header_flags: Optional[Tuple[bool, bool, bool]] = None,
+    ) -> str:
         """
         Phase 4: Smart Number Formatting.
         Applies semantic formatting based on header keywords and value type.
         (Duplicated logic from CSV to keep converters independent)
         """
-        header_lower = str(header).lower()
+        if header_flags is None:
+            header_flags = self._header_flags(header)
+        is_currency, is_percentage, is_identifier = header_flags
         value = str(value).strip()
 
         if not value:
@@ -134,26 +165,19 @@ class XlsxConverter(FormatConverter):
 
         if is_number:
             # Currency
-            if any(
-                k in header_lower
-                for k in ["revenue", "price", "cost", "salary", "usd", "amount"]
-            ):
+            if is_currency:
                 if not value.startswith("$") and not value.startswith("€"):
                     return f"${float_val:,.2f}"
 
             # Percentage
-            if "rate" in header_lower or "percent" in header_lower:
+            if is_percentage:
                 if float_val < 1.0:
                     return f"{float_val:.1%}"
                 return f"{float_val}%"
 
             # Large Numbers
             if float_val > 999:
-                if (
-                    "id" not in header_lower
-                    and "code" not in header_lower
-                    and "year" not in header_lower
-                ):
+                if not is_identifier:
                     return (
                         f"{float_val:,.0f}"
                         if float_val.is_integer()
@@ -177,7 +201,8 @@ class XlsxConverter(FormatConverter):
         lines.append("| " + " | ".join(safe_headers) + " |")
         lines.append("| " + " | ".join("---" for _ in headers) + " |")
 
-        for _, row in df.iterrows():
+        # Plain tuples per row; iterrows would build a Series for each one
+        for row in df.itertuples(index=False, name=None):
             cells = []
             for v in row:
                 val = str(v).strip()
@@ -197,22 +222,27 @@ class XlsxConverter(FormatConverter):
             return ""
 
         lines: List[str] = []
-        headers = list(df.columns)
+        # Per column (once, not per cell): header, "{Header} is " prefix and
+        # smart formatting flags
+        columns = [
+            (header, f"{header.strip()} is ", self._header_flags(header))
+            for header in map(str, df.columns)
+        ]
+        sheet_context = f"Sheet: {sheet_name}"
 
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False, name=None):
             # Phase 4: Start with Sheet context
-            row_parts: List[str] = [f"Sheet: {sheet_name}"]
+            row_parts: List[str] = [sheet_context]
 
-            for header in headers:
-                raw_val = str(row[header])
+            for (header, prefix, header_flags), value in zip(columns, row):
+                raw_val = str(value)
                 if not raw_val or raw_val.strip() == "":
                     continue
 
-                formatted_val = self._format_smart_value(str(header), raw_val)
-                clean_header = str(header).strip()
+                formatted_val = self._format_smart_value(header, raw_val, header_flags)
 
                 # Syntax: "{Header} is {Value}"
-                row_parts.append(f"{clean_header} is {formatted_val}")
+                row_parts.append(prefix + formatted_val)
 
             if len(row_parts) > 1:
                 # Join with periods.
@@ -9,6 +9,7 @@ Replaces sentence-transformers for unified embedding approach.
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
@@ -30,6 +31,14 @@ class HybridVector:
     sparse: SparseVector  # Variable length
 
 
+@dataclass
+class HybridBatch:
+    """Columnar hybrid embeddings for a list of texts (row i = text i)."""
+
+    dense: np.ndarray  # (N, 384) float32 matrix
+    sparse: List[SparseVector]
+
+
 class HybridEmbedder:
     """
     Generates both dense and sparse embeddings using fastembed.
@@ -67,6 +76,51 @@ class HybridEmbedder:
 
         logger.info("hybrid_embedding_models_loaded")
 
+    def _embed_dense(self, texts: List[str]) -> np.ndarray:
+        """
+        Run the dense model over texts sorted by length (smart batching).
+
+        The model pads every batch to its longest text, so grouping texts of
+        similar length cuts wasted padding. Vectors are scattered back into a
+        single float32 (N, D) matrix in input order.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        matrix: Optional[np.ndarray] = None
+        for i, vector in zip(order, self._dense_model.embed(sorted_texts)):
+            if matrix is None:
+                matrix = np.empty((len(texts), len(vector)), dtype=np.float32)
+            matrix[i] = vector
+        return matrix
+
+    def embed_batch(self, texts: List[str]) -> HybridBatch:
+        """
+        Generate hybrid embeddings as a dense matrix plus sparse vectors.
+
+        Dense rows stay in one numpy matrix instead of per-chunk float lists;
+        callers serialize them directly (orjson OPT_SERIALIZE_NUMPY).
+
+        Args:
+            texts: List of text strings to embed (must be non-empty).
+
+        Returns:
+            HybridBatch with an (N, D) dense matrix and N sparse vectors.
+        """
+        try:
+            dense_matrix = self._embed_dense(texts)
+            sparse_vectors = [
+                SparseVector(
+                    indices=sparse.indices.tolist(),
+                    values=sparse.values.tolist(),
+                )
+                for sparse in self._sparse_model.embed(texts)
+            ]
+            return HybridBatch(dense=dense_matrix, sparse=sparse_vectors)
+
+        except Exception as e:
+            logger.error("hybrid_embedding_failed", error=str(e))
+            raise
+
     def embed(self, texts: List[str]) -> List[HybridVector]:
         """
         Generate hybrid (dense + sparse) embeddings for texts.
@@ -80,29 +134,12 @@ class HybridEmbedder:
         if not texts:
             return []
 
-        try:
-            # Generate both embedding types
-            dense_embeddings = list(self._dense_model.embed(texts))
-            sparse_embeddings = list(self._sparse_model.embed(texts))
-
-            # Combine into HybridVector
-            results = []
-            for dense, sparse in zip(dense_embeddings, sparse_embeddings):
-                results.append(
-                    HybridVector(
-                        dense=dense.tolist(),
-                        sparse=SparseVector(
-                            indices=sparse.indices.tolist(),
-                            values=sparse.values.tolist(),
-                        ),
-                    )
-                )
-
-            return results
-
-        except Exception as e:
-            logger.error("hybrid_embedding_failed", error=str(e))
-            raise
+        batch = self.embed_batch(texts)
+        # One tolist() for the whole dense matrix
+        return [
+            HybridVector(dense=dense, sparse=sparse)
+            for dense, sparse in zip(batch.dense.tolist(), batch.sparse)
+        ]
 
     def embed_dense_only(self, texts: List[str]) -> List[List[float]]:
         """
@@ -117,8 +154,7 @@ class HybridEmbedder:
         if not texts:
             return []
 
-        embeddings = list(self._dense_model.embed(texts))
-        return [e.tolist() for e in embeddings]
+        return self._embed_dense(texts).tolist()
 
     def get_token_counts(self, texts: List[str]) -> List[int]:
         """
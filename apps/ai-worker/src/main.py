@@ -10,12 +10,13 @@ import os
 # when multiple workers download models concurrently
 os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 
-from .callback import send_callback
+from .callback import close_callback_client, send_callback
 from .config import settings
 from .hybrid_embedder import HybridEmbedder
 from .logging_config import configure_logging, get_logger
@@ -40,9 +41,25 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     logger.info("application_starting")
+    if settings.docling_warmup:
+        # Pay Docling's model load before serving, not inside the first request
+        ocr_modes = [
+            mode.strip()
+            for mode in settings.docling_warmup_ocr_modes.split(",")
+            if mode.strip()
+        ]
+        try:
+            await asyncio.to_thread(get_pdf_converter("docling").warmup, ocr_modes)
+        except Exception as e:
+            logger.warning("docling_warmup_failed", error=str(e))
     logger.info("http_server_ready")
     yield
     logger.info("application_stopping")
+    # Bounded so a stuck backend connection cannot stall shutdown
+    try:
+        await asyncio.wait_for(close_callback_client(), timeout=5.0)
+    except asyncio.TimeoutError:
+        logger.warning("callback_client_close_timeout")
 
 
 app = FastAPI(
@@ -209,7 +226,11 @@ async def process_document(request: ProcessRequest):
             pipeline = create_pipeline(profile_config)
 
             metrics_collector.start_stage()
-            chunks, embedding_time_ms = pipeline.run(output.markdown, category)
+            # Chunking/embedding is CPU-bound; keep the event loop free for
+            # health checks and other in-flight requests (ONNX releases the GIL)
+            chunks, embedding_time_ms = await asyncio.to_thread(
+                pipeline.run, output.markdown, category
+            )
             total_pipeline_ms = metrics_collector.end_chunking()
 
             # Fix: Chunking time currently includes embedding time because pipeline.run does both.
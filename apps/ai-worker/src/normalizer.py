@@ -13,6 +13,9 @@ class MarkdownNormalizer:
     # Improvement: Handles indented blocks slightly better in extraction logic
     _CODE_BLOCK_PATTERN = re.compile(r"(```[^\n]*\n)(.*?)(```)", re.DOTALL)
 
+    # Placeholders left by _extract_code_blocks (index without leading zeros)
+    _CODE_BLOCK_PLACEHOLDER_PATTERN = re.compile(r"__M_NORM_BLOCK_(0|[1-9]\d*)__")
+
     # Matches bullets: * or + at start of line -> -
     _BULLET_PATTERN = re.compile(r"^(\s*)([*+])(\s)", re.MULTILINE)
 
@@ -31,6 +34,33 @@ class MarkdownNormalizer:
     # Note: Handling "H3 followed by H2" via regex is complex.
     # For Phase 4, cleaning strict duplicates (H2->H2) is the 80/20 win.
 
+    # Fence lines (``` with optional leading whitespace), for balance checks
+    _FENCE_LINE_PATTERN = re.compile(r"^\s*```", re.MULTILINE)
+
+    # Paragraph boundary: blank line, possibly containing whitespace
+    _PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+
+    # Junk code blocks (plus surrounding newlines): empty, or only a page number
+    _EMPTY_CODE_BLOCK_PATTERN = re.compile(r"\n*```[^\n]*\n\s*```\n*", re.MULTILINE)
+    _PAGE_NUMBER_CODE_BLOCK_PATTERN = re.compile(
+        r"\n*```[^\n]*\n[\s|]*[1-9]\d{0,2}[\s|]*\n```\n*",
+        re.MULTILINE,
+    )
+
+    # Lines starting with markdown syntax are never merged into the previous line
+    _SOFT_BREAK_SKIP_PATTERN = re.compile(
+        r"^\s*("
+        r"#{1,6}\s|"  # Headings
+        r"[-*+]\s|"  # List items
+        r"\d+\.\s|"  # Numbered lists
+        r">\s?|"  # Blockquotes
+        r"\|"  # Tables
+        r")"
+    )
+    _SENTENCE_END_PATTERN = re.compile(r"[.!?:]$")
+    _BRACKET_END_PATTERN = re.compile(r"[\]\)]$")
+    _LOWERCASE_START_PATTERN = re.compile(r"[a-z]")
+
     # Page number artifact patterns (strict: 1-999 only)
     _PAGE_ARTIFACT_PATTERNS = [
         re.compile(r"^[1-9]\d{0,2}$"),  # Standalone: 1-999
@@ -93,16 +123,21 @@ class MarkdownNormalizer:
         return self._CODE_BLOCK_PATTERN.sub(replacer, text)
 
     def _restore_code_blocks(self, text: str, storage: List[str]) -> str:
-        for i, block in enumerate(storage):
-            text = text.replace(f"__M_NORM_BLOCK_{i}__", block)
-        return text
+        if not storage:
+            return text
+
+        # One scan for all placeholders (a replace() per block is quadratic)
+        def replacer(match):
+            index = int(match.group(1))
+            return storage[index] if index < len(storage) else match.group(0)
+
+        return self._CODE_BLOCK_PLACEHOLDER_PATTERN.sub(replacer, text)
 
     def _fix_unclosed_code_blocks(self, text: str) -> str:
         # Allow whitespace before backticks
-        fence_pattern = re.compile(r"^\s*```", re.MULTILINE)
-        matches = list(fence_pattern.finditer(text))
+        fence_count = sum(1 for _ in self._FENCE_LINE_PATTERN.finditer(text))
 
-        if len(matches) % 2 == 1:
+        if fence_count % 2 == 1:
             if not text.endswith("\n"):
                 text += "\n"
             text += "```"
@@ -127,7 +162,7 @@ class MarkdownNormalizer:
         if not markdown:
             return ""
 
-        paragraphs = re.split(r"\n\s*\n", markdown)
+        paragraphs = self._PARAGRAPH_BREAK_PATTERN.split(markdown)
         result = []
 
         for para in paragraphs:
@@ -161,15 +196,10 @@ class MarkdownNormalizer:
             return ""
 
         # Pattern 1: Empty code blocks + surrounding newlines
-        empty_pattern = re.compile(r"\n*```[^\n]*\n\s*```\n*", re.MULTILINE)
-        markdown = empty_pattern.sub("\n\n", markdown)
+        markdown = self._EMPTY_CODE_BLOCK_PATTERN.sub("\n\n", markdown)
 
         # Pattern 2: Code blocks with page number + surrounding newlines
-        page_pattern = re.compile(
-            r"\n*```[^\n]*\n[\s|]*[1-9]\d{0,2}[\s|]*\n```\n*",
-            re.MULTILINE,
-        )
-        markdown = page_pattern.sub("\n\n", markdown)
+        markdown = self._PAGE_NUMBER_CODE_BLOCK_PATTERN.sub("\n\n", markdown)
 
         return markdown
 
@@ -196,17 +226,6 @@ class MarkdownNormalizer:
         lines = markdown.split("\n")
         result = []
 
-        # Patterns for lines that should NOT be merged into
-        skip_patterns = re.compile(
-            r"^\s*("
-            r"#{1,6}\s|"  # Headings
-            r"[-*+]\s|"  # List items
-            r"\d+\.\s|"  # Numbered lists
-            r">\s?|"  # Blockquotes
-            r"\|"  # Tables
-            r")"
-        )
-
         i = 0
         while i < len(lines):
             current = lines[i]
@@ -223,9 +242,15 @@ class MarkdownNormalizer:
                     # Pattern: "mid-sentence\n\nlowercase continuation"
                     if i + 2 < len(lines) and current_stripped:
                         after_empty = lines[i + 2].lstrip()
-                        no_sentence_end = not re.search(r"[.!?:]$", current_stripped)
-                        lowercase_start = bool(re.match(r"[a-z]", after_empty))
-                        no_bracket_end = not re.search(r"[\]\)]$", current_stripped)
+                        no_sentence_end = not self._SENTENCE_END_PATTERN.search(
+                            current_stripped
+                        )
+                        lowercase_start = bool(
+                            self._LOWERCASE_START_PATTERN.match(after_empty)
+                        )
+                        no_bracket_end = not self._BRACKET_END_PATTERN.search(
+                            current_stripped
+                        )
 
                         if no_sentence_end and lowercase_start and no_bracket_end:
                             # PDF artifact → merge across empty line
@@ -240,7 +265,7 @@ class MarkdownNormalizer:
                     continue
 
                 # Skip if next line starts with markdown syntax
-                if skip_patterns.match(next_stripped):
+                if self._SOFT_BREAK_SKIP_PATTERN.match(next_stripped):
                     result.append(current)
                     i += 1
                     continue
@@ -252,8 +277,12 @@ class MarkdownNormalizer:
                     continue
 
                 # Conservative merge: ONLY if next starts lowercase
-                starts_with_lowercase = bool(re.match(r"[a-z]", next_stripped))
-                ends_with_bracket = bool(re.search(r"[\]\)]$", current_stripped))
+                starts_with_lowercase = bool(
+                    self._LOWERCASE_START_PATTERN.match(next_stripped)
+                )
+                ends_with_bracket = bool(
+                    self._BRACKET_END_PATTERN.search(current_stripped)
+                )
 
                 if starts_with_lowercase and not ends_with_bracket:
                     # Safe to merge: lowercase continuation
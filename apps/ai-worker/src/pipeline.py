@@ -53,14 +53,18 @@ class ProcessingPipeline:
 
     def _strip_breadcrumb_prefix(self, content: str) -> str:
         """Remove breadcrumb prefix (> Chapter > Section) from content."""
-        lines = content.split("\n")
-        if lines and lines[0].startswith(">"):
-            # Skip breadcrumb line and any following empty lines
-            start = 1
-            while start < len(lines) and not lines[start].strip():
-                start += 1
-            return "\n".join(lines[start:])
-        return content
+        if not content.startswith(">"):
+            return content
+        # Walk a cursor past the breadcrumb line and any following empty lines
+        # instead of splitting and re-joining the whole chunk
+        pos = content.find("\n") + 1
+        while pos:
+            end = content.find("\n", pos)
+            line = content[pos:end] if end != -1 else content[pos:]
+            if line.strip():
+                return content[pos:]
+            pos = end + 1
+        return ""
 
     def merge_small_chunks(
         self, chunks: List[Dict[str, Any]], min_chars: int, max_chars: int
@@ -295,17 +299,18 @@ class ProcessingPipeline:
         # 4. Generate hybrid embeddings and token counts (with timing)
         texts = [c["content"] for c in chunks]
         embed_start = time.time()
-        hybrid_vectors = self.embedder.embed(texts)
+        batch = self.embedder.embed_batch(texts)
         token_counts = self.embedder.get_token_counts(texts)
         embedding_time_ms = int((time.time() - embed_start) * 1000)
 
         for i, chunk in enumerate(chunks):
             # Phase 5: Hybrid vector format for Qdrant
+            # Dense is a numpy row view; orjson serializes it in the callback
             chunk["vector"] = {
-                "dense": hybrid_vectors[i].dense,
+                "dense": batch.dense[i],
                 "sparse": {
-                    "indices": hybrid_vectors[i].sparse.indices,
-                    "values": hybrid_vectors[i].sparse.values,
+                    "indices": batch.sparse[i].indices,
+                    "values": batch.sparse[i].values,
                 },
             }
             chunk["metadata"]["tokenCount"] = token_counts[i]
@@ -3,34 +3,23 @@
 
 from typing import Dict, Type
 
-from .converters import (
-    CsvConverter,
-    DoclingPdfConverter,
-    DocxConverter,
-    EpubConverter,
-    FormatConverter,
-    HtmlConverter,
-    JsonConverter,
-    MarkdownConverter,
-    PptxConverter,
-    PyMuPDFConverter,
-    TxtConverter,
-    XlsxConverter,
-)
-
-# Format → Converter class mapping
+from . import converters
+from .converters import FormatConverter
+
+# Format → Converter class name, resolved on use so each format's
+# dependencies are only imported when a file of that format arrives
 # Note: PDF uses get_pdf_converter() for dynamic selection
-FORMAT_CONVERTERS: Dict[str, Type[FormatConverter]] = {
-    "pdf": PyMuPDFConverter,  # Default fast converter
-    "docx": DocxConverter,  # Dedicated DOCX converter (Docling)
-    "txt": TxtConverter,
-    "md": MarkdownConverter,
-    "json": JsonConverter,
-    "csv": CsvConverter,
-    "html": HtmlConverter,
-    "xlsx": XlsxConverter,
-    "epub": EpubConverter,
-    "pptx": PptxConverter,
+FORMAT_CONVERTERS: Dict[str, str] = {
+    "pdf": "PyMuPDFConverter",  # Default fast converter
+    "docx": "DocxConverter",  # Dedicated DOCX converter (Docling)
+    "txt": "TxtConverter",
+    "md": "MarkdownConverter",
+    "json": "JsonConverter",
+    "csv": "CsvConverter",
+    "html": "HtmlConverter",
+    "xlsx": "XlsxConverter",
+    "epub": "EpubConverter",
+    "pptx": "PptxConverter",
 }
 
 # Format → Category mapping
@@ -62,11 +51,12 @@ def get_converter(file_format: str) -> FormatConverter:
         ValueError: If format is not supported
     """
     file_format = file_format.lower()
-    converter_cls = FORMAT_CONVERTERS.get(file_format)
+    converter_name = FORMAT_CONVERTERS.get(file_format)
 
-    if converter_cls is None:
+    if converter_name is None:
         raise ValueError(f"Unsupported format: {file_format}")
 
+    converter_cls: Type[FormatConverter] = getattr(converters, converter_name)
     return converter_cls()
 
 
@@ -81,8 +71,8 @@ def get_pdf_converter(converter_type: str = "pymupdf") -> FormatConverter:
         FormatConverter instance for PDF
     """
     if converter_type == "docling":
-        return DoclingPdfConverter()
-    return PyMuPDFConverter()
+        return converters.DoclingPdfConverter()
+    return converters.PyMuPDFConverter()
 
 
 def get_category(file_format: str) -> str:
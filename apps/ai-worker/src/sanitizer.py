@@ -18,6 +18,8 @@ class InputSanitizer:
 
     # Control characters to remove (0x01-0x1f), excluding \t (0x09) and \n (0x0a)
     _CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+    # Trailing spaces/tabs at the end of each line
+    _TRAILING_WHITESPACE_PATTERN = re.compile(r"[ \t]+$", re.MULTILINE)
 
     def sanitize(self, text: str) -> str:
         """
@@ -33,8 +35,13 @@ class InputSanitizer:
         if not text:
             return ""
 
-        # 1. Fix mojibake and encoding issues with ftfy
-        text = ftfy.fix_text(text)
+        # 1. Fix mojibake and encoding issues with ftfy.
+        # ASCII text cannot contain mojibake. Without HTML entities ("&") or
+        # terminal escapes ("\x1b"), ftfy's remaining fixes (line breaks,
+        # control chars) are repeated below, so its slow per-line pass is
+        # skipped.
+        if not text.isascii() or "&" in text or "\x1b" in text:
+            text = ftfy.fix_text(text)
 
         # 2. Remove BOM (Byte Order Mark)
         text = text.lstrip("\ufeff")
@@ -42,13 +49,14 @@ class InputSanitizer:
         # 3. Normalize to NFC unicode form
         text = unicodedata.normalize("NFC", text)
 
-        # 4. Remove null bytes and control characters (keep \n and \t)
-        text = self._CONTROL_CHAR_PATTERN.sub("", text)
-
-        # 5. Normalize line endings: \r\n and \r -> \n
+        # 4. Normalize line endings: \r\n and \r -> \n
+        # (before control char removal, matching ftfy's order when it is skipped)
         text = text.replace("\r\n", "\n").replace("\r", "\n")
 
+        # 5. Remove null bytes and control characters (keep \n and \t)
+        text = self._CONTROL_CHAR_PATTERN.sub("", text)
+
         # 6. Strip trailing whitespace from each line
-        text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+        text = self._TRAILING_WHITESPACE_PATTERN.sub("", text)
 
         return text
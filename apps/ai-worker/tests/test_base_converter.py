@@ -4,6 +4,8 @@ Unit tests for FormatConverter base class methods.
 Tests _sanitize_raw() and _post_process() inherited methods.
 """
 
+from pathlib import Path
+
 import pytest
 
 from src.converters.base import FormatConverter
@@ -184,3 +186,53 @@ class TestPostProcessPymupdf:
         result = converter._post_process_pymupdf(text)
         assert "\n\n" in result
         assert "sentence.\n" in result
+
+
+class TestOpenMapped:
+    """Tests for FormatConverter._open_mapped() helper."""
+
+    def test_decodes_file_contents(self, converter, tmp_path):
+        """Mapped files decode like read_bytes() would."""
+        path = tmp_path / "doc.txt"
+        path.write_bytes("Héllo\nWorld".encode("utf-8"))
+        with converter._open_mapped(path) as data:
+            assert str(data, "utf-8") == "Héllo\nWorld"
+
+    def test_empty_file(self, converter, tmp_path):
+        """Empty files yield empty bytes instead of failing to map."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        with converter._open_mapped(path) as data:
+            assert data == b""
+
+
+class TestPdfMayBeEncrypted:
+    """Tests for FormatConverter._pdf_may_be_encrypted() pre-check."""
+
+    FIXTURE_PDF = Path(__file__).parent / "fixtures" / "sample.pdf"
+
+    def test_plain_pdf(self, converter):
+        """PDFs without an /Encrypt entry skip the full check."""
+        assert converter._pdf_may_be_encrypted(self.FIXTURE_PDF) is False
+
+    def test_encrypt_in_trailer(self, converter, tmp_path):
+        """An /Encrypt entry in the trailer is detected."""
+        path = tmp_path / "enc.pdf"
+        path.write_bytes(
+            b"%PDF-1.4\n" + b"0" * 10000 + b"\ntrailer\n<< /Size 5 /Encrypt 4 0 R >>"
+            b"\nstartxref\n9\n%%EOF\n"
+        )
+        assert converter._pdf_may_be_encrypted(path) is True
+
+    def test_encrypt_at_startxref_offset(self, converter, tmp_path):
+        """A large xref stream pushes /Encrypt far from the end of the file."""
+        body = b"%PDF-1.5\n" + b"0" * 10000
+        xref = b"9 0 obj\n<< /Type /XRef /Encrypt 4 0 R >>\nstream\n"
+        path = tmp_path / "enc.pdf"
+        path.write_bytes(
+            body
+            + xref
+            + b"x" * 20000
+            + b"\nendstream\nendobj\nstartxref\n%d\n%%%%EOF\n" % len(body)
+        )
+        assert converter._pdf_may_be_encrypted(path) is True
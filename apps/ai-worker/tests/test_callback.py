@@ -1,5 +1,6 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 from src.callback import send_callback
 from src.models import ProcessingResult
@@ -33,14 +34,10 @@ async def test_callback_payload_structure(monkeypatch):
     call_args = mock_post.call_args
     assert call_args is not None
 
-    # call_args could be positional or keyword args depending on implementation
-    # code: await client.post(settings.callback_url, json=payload)
-    # args[0] is url if positional, or kwargs['url']
+    # code: await client.post(settings.callback_url, content=orjson.dumps(payload), ...)
     kwargs = call_args.kwargs
-    payload = kwargs.get("json") or call_args[1]["json"] if len(call_args) > 1 else None
-
-    if payload is None and "json" in kwargs:
-        payload = kwargs["json"]
+    payload = orjson.loads(kwargs["content"])
+    assert kwargs["headers"]["Content-Type"] == "application/json"
 
     assert payload["documentId"] == "doc-123"
     assert payload["success"] is True
@@ -49,6 +46,27 @@ async def test_callback_payload_structure(monkeypatch):
     assert payload["result"]["chunks"][0]["embedding"] == [0.1] * 384
 
 
+@pytest.mark.asyncio
+async def test_callback_serializes_numpy_dense_vectors(monkeypatch):
+    """Dense vectors passed as numpy rows are serialized as JSON arrays."""
+    import numpy as np
+
+    mock_post = AsyncMock(return_value=MagicMock(status_code=200))
+    monkeypatch.setattr("httpx.AsyncClient.post", mock_post)
+
+    dense = np.array([[0.5, 0.25]], dtype=np.float32)
+    result = ProcessingResult(
+        success=True,
+        processed_content="# Markdown",
+        chunks=[{"content": "chunk", "vector": {"dense": dense[0]}}],
+    )
+
+    assert await send_callback("doc-123", result) is True
+
+    payload = orjson.loads(mock_post.call_args.kwargs["content"])
+    assert payload["result"]["chunks"][0]["vector"]["dense"] == [0.5, 0.25]
+
+
 @pytest.mark.asyncio
 async def test_callback_failure_structure(monkeypatch):
     mock_post = MagicMock()
@@ -63,7 +81,7 @@ async def test_callback_failure_structure(monkeypatch):
 
     assert mock_post.called
     kwargs = mock_post.call_args.kwargs
-    payload = kwargs.get("json")
+    payload = orjson.loads(kwargs["content"])
 
     assert payload["success"] is False
     assert payload["error"]["code"] == "ERROR"
@@ -102,3 +120,19 @@ async def test_callback_connection_error_returns_false(monkeypatch):
     success = await send_callback("doc-123", result)
 
     assert success is False
+
+
+@pytest.mark.asyncio
+async def test_callback_client_is_reused_until_closed():
+    """Shared client is reused across calls and recreated after close."""
+    from src.callback import close_callback_client, get_callback_client
+
+    client = get_callback_client()
+    assert get_callback_client() is client
+
+    await close_callback_client()
+    assert client.is_closed
+
+    new_client = get_callback_client()
+    assert new_client is not client
+    await close_callback_client()
@@ -164,6 +164,18 @@ class TestCsvProcessorEdgeCases:
         assert "Test" in result.markdown
         assert "Line 1" in result.markdown or "Line 1 Line 2" in result.markdown
 
+    @pytest.mark.asyncio
+    async def test_ragged_rows_fit_header_width(self, processor, tmp_path):
+        """Short rows are padded and long rows truncated to the header width."""
+        csv_file = tmp_path / "ragged.csv"
+        csv_file.write_text("A,B,C\n1,2\n3,4,5,6\n")
+
+        result = await processor.process(str(csv_file))
+
+        assert "| 1 | 2 |  |" in result.markdown
+        assert "| 3 | 4 | 5 |" in result.markdown
+        assert result.metadata["row_count"] == 2
+
     @pytest.mark.asyncio
     async def test_file_not_found(self, processor):
         """Missing file returns error in output."""
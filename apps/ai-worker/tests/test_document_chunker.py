@@ -99,6 +99,20 @@ Deep content
         assert len(chunks) == 1
         assert chunks[0]["content"] == text
 
+    def test_header_inside_code_fence_not_split(self, chunker):
+        """Test '#' lines inside fenced code blocks are not treated as headers."""
+        text = "# Setup\n```bash\n# install deps\npip install x\n```\nDone."
+        chunks = chunker.chunk(text)
+        assert len(chunks) == 1
+        assert chunks[0]["metadata"]["breadcrumbs"] == ["Setup"]
+        assert "# install deps" in chunks[0]["content"]
+
+    def test_paragraph_breaks_preserved(self, chunker):
+        """Test section content keeps its original paragraph breaks."""
+        text = "# Intro\nFirst paragraph.\n\nSecond paragraph."
+        chunks = chunker.chunk(text)
+        assert chunks[0]["content"].endswith("First paragraph.\n\nSecond paragraph.")
+
 
 class TestHeaderLevels:
     """Tests for header_levels parameter in DocumentChunker."""
@@ -188,6 +188,34 @@ class TestEpubProcessorEdgeCases:
         assert "日本語" in result.markdown
         assert "こんにちは" in result.markdown
 
+    @pytest.mark.asyncio
+    async def test_chapters_in_subdirectory_with_images(self, processor, tmp_path):
+        """Chapters under nested, URL-quoted paths are read; images are ignored."""
+        book = epub.EpubBook()
+        book.set_identifier("test")
+        book.set_title("Test")
+
+        chapter = epub.EpubHtml(title="Part 1", file_name="text/part 1.xhtml")
+        chapter.content = "<html><body><h1>Part One</h1><p>Body</p></body></html>"
+        image = epub.EpubImage(
+            uid="img", file_name="images/pic.png", media_type="image/png"
+        )
+        image.content = b"\x89PNG"
+
+        book.add_item(chapter)
+        book.add_item(image)
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav", chapter]
+
+        epub_path = tmp_path / "nested.epub"
+        epub.write_epub(str(epub_path), book, {})
+
+        result = await processor.process(str(epub_path))
+
+        assert "# Part One" in result.markdown
+        assert result.chapter_count == 1
+
 
 class TestEpubProcessorErrors:
     """Tests for error cases."""
@@ -239,3 +267,28 @@ class TestEpubProcessorMetadata:
 
         assert "title" in result.metadata
         assert result.metadata["title"] == "Test Book"
+
+
+class TestEpubHtmlToMarkdown:
+    """Tests for chapter HTML to Markdown conversion."""
+
+    def test_inline_and_block_markers(self, processor):
+        """Semantic tags map to Markdown markers; scripts and comments are dropped."""
+        html = (
+            "<?xml version='1.0' encoding='utf-8'?>"
+            "<html><body><h2>Intro</h2>"
+            "<p>Some <b>bold</b> and <a href='u'>link</a><!-- note -->.</p>"
+            "<script>var x;</script><ul><li>one</li></ul></body></html>"
+        )
+        markdown = processor._html_to_markdown(html)
+
+        assert "## Intro" in markdown
+        assert "Some **bold** and [link](u) ." in markdown
+        assert "- one" in markdown
+        assert "var x" not in markdown
+        assert "note" not in markdown
+
+    def test_deeply_nested_chapter(self, processor):
+        """Nesting deeper than Python's recursion limit is converted."""
+        html = "<html><body>" + "<div>" * 1500 + "<p>Deep</p>" + "</div>" * 1500
+        assert processor._html_to_markdown(html + "</body></html>") == "Deep"
@@ -1,7 +1,7 @@
 # apps/ai-worker/tests/test_html_processor.py
 """
 Unit tests for HtmlProcessor module.
-Tests HTML to Markdown conversion with BeautifulSoup and markdownify.
+Tests HTML to Markdown conversion with lxml.
 """
 
 import pytest
@@ -238,6 +238,40 @@ class TestHtmlProcessorCleanup:
         assert "Copyright" not in result.markdown
 
 
+    @pytest.mark.asyncio
+    async def test_text_after_removed_elements_kept(self, processor, tmp_path):
+        """Text following a removed tag or comment is kept."""
+        html_file = tmp_path / "tails.html"
+        html_file.write_text(
+            "<p>Before<script>var x;</script> middle<!-- note --> after</p>"
+        )
+
+        result = await processor.process(str(html_file))
+
+        assert "Before middle after" in result.markdown
+        assert "var x" not in result.markdown
+        assert "note" not in result.markdown
+
+
+class TestHtmlProcessorMetadata:
+    """Tests for metadata extraction."""
+
+    @pytest.mark.asyncio
+    async def test_title_and_description(self, processor, tmp_path):
+        """Title and meta description are read from the head."""
+        html_file = tmp_path / "meta.html"
+        html_file.write_text(
+            "<html><head><title> Page Title </title>"
+            '<meta name="description" content="About this page"></head>'
+            "<body><p>Body</p></body></html>"
+        )
+
+        result = await processor.process(str(html_file))
+
+        assert result.metadata["title"] == "Page Title"
+        assert result.metadata["description"] == "About this page"
+
+
 class TestHtmlProcessorEdgeCases:
     """Tests for edge cases."""
 
@@ -114,3 +114,65 @@ class TestHybridEmbedder:
         assert hasattr(results[0], "dense")
         assert hasattr(results[0].sparse, "indices")
         assert hasattr(results[0].sparse, "values")
+
+
+def test_dense_embeddings_keep_input_order_when_length_sorted():
+    """Length-sorted dense batching must scatter results back to input order."""
+    import numpy as np
+
+    from src.hybrid_embedder import HybridEmbedder
+
+    class FakeDenseModel:
+        def __init__(self):
+            self.seen = []
+
+        def embed(self, texts):
+            self.seen = list(texts)
+            for text in texts:
+                yield np.array([float(len(text))], dtype=np.float32)
+
+    embedder = object.__new__(HybridEmbedder)
+    fake = FakeDenseModel()
+    embedder._dense_model = fake
+
+    texts = ["medium text", "a", "the longest text of all", "ab"]
+    vectors = embedder.embed_dense_only(texts)
+
+    assert fake.seen == sorted(texts, key=len)
+    assert vectors == [[float(len(t))] for t in texts]
+
+
+def test_embed_batch_returns_dense_matrix_and_sparse_vectors():
+    """embed_batch keeps dense rows in one float32 matrix, row i = text i."""
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from src.hybrid_embedder import HybridEmbedder
+
+    class FakeDenseModel:
+        def embed(self, texts):
+            for text in texts:
+                yield np.array([float(len(text)), 1.0], dtype=np.float32)
+
+    class FakeSparseModel:
+        def embed(self, texts):
+            for text in texts:
+                yield SimpleNamespace(
+                    indices=np.array([len(text)]), values=np.array([0.5])
+                )
+
+    embedder = object.__new__(HybridEmbedder)
+    embedder._dense_model = FakeDenseModel()
+    embedder._sparse_model = FakeSparseModel()
+
+    batch = embedder.embed_batch(["abc", "a"])
+
+    assert batch.dense.dtype == np.float32
+    assert batch.dense.shape == (2, 2)
+    assert batch.dense[:, 0].tolist() == [3.0, 1.0]
+    assert [s.indices for s in batch.sparse] == [[3], [1]]
+
+    vectors = embedder.embed(["abc", "a"])
+    assert vectors[0].dense == [3.0, 1.0]
+    assert all(isinstance(v, float) for v in vectors[1].dense)
@@ -126,6 +126,13 @@ code2
         assert "```bash" in result
         assert result.count("```") == 4
 
+    def test_many_code_blocks_restored_in_order(self, normalizer):
+        """Each placeholder gets its own block back (block 1 vs block 10+)."""
+        text = "\n\n".join(f"```\nblock {i}\n```" for i in range(12))
+        result = normalizer.normalize(text)
+        assert result == text + "\n"
+        assert "__M_NORM_BLOCK_" not in result
+
     def test_bullets_not_in_words(self, normalizer):
         """Stars and plus in the middle of text are not converted."""
         text = "This is 2*3+4 math\nAnd a*b+c algebra"
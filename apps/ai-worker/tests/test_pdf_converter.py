@@ -5,7 +5,7 @@ Tests OCR mode behavior, converter caching, and error handling.
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.converters.pdf_converter import DoclingPdfConverter
 from src.converters.pymupdf_converter import PyMuPDFConverter
@@ -40,6 +40,25 @@ class TestDoclingPdfConverter:
             assert result.markdown == ""
             assert result.metadata.get("error") == "PASSWORD_PROTECTED"
 
+    @pytest.mark.asyncio
+    async def test_auto_ocr_check_reuses_markdown_export(self, converter, tmp_path):
+        """Auto OCR detection measures the existing export instead of re-exporting."""
+        fake_pdf = tmp_path / "scan.pdf"
+        fake_pdf.write_bytes(b"%PDF-1.4 fake content")
+
+        docling = MagicMock()
+        docling.convert.return_value.document.export_to_markdown.return_value = "x"
+        docling.convert.return_value.document.pages = [1, 2]
+
+        with patch.object(
+            converter, "_is_password_protected", return_value=False
+        ), patch.object(converter, "_get_docling_converter", return_value=docling):
+            result = await converter.to_markdown(str(fake_pdf), ocr_mode="auto")
+
+        document = docling.convert.return_value.document
+        assert document.export_to_markdown.call_count == 1
+        assert result.metadata["ocr_applied"] is True
+
     def test_cache_key_format(self, converter):
         """Cache key includes OCR mode and thread count."""
         # Access internal cache key format
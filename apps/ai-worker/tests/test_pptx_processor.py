@@ -87,6 +87,17 @@ class TestPptxProcessorSlides:
 
             assert "Introduction" in result.markdown
 
+    def test_h1_fallback_markers(self, processor):
+        """Without '---' rules, every H1 after the first starts a slide."""
+        markdown = "# Slide 1\nText\n## Sub\n# Slide 2\nMore\n# Slide 3"
+        result = processor._ensure_slide_markers(markdown)
+
+        assert result == (
+            "# Slide 1\nText\n## Sub\n"
+            "\n<!-- slide -->\n\n# Slide 2\nMore\n"
+            "\n<!-- slide -->\n\n# Slide 3"
+        )
+
 
 class TestPptxProcessorContent:
     """Tests for content extraction."""
@@ -254,3 +265,14 @@ class TestPptxProcessorMetadata:
 
             # Slide count is based on slide markers + 1
             assert result.slide_count >= 1
+
+
+class TestPptxProcessorConverterCache:
+    """Tests for Docling converter reuse."""
+
+    def test_docling_converter_shared_across_instances(self):
+        """A new PptxConverter reuses the already-built Docling converter."""
+        shared = MagicMock()
+        with patch("src.converters.pptx_converter._docling_converter", shared):
+            assert PptxConverter()._get_docling_converter() is shared
+            assert PptxConverter()._get_docling_converter() is shared
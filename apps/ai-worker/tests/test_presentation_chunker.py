@@ -89,3 +89,25 @@ class TestPresentationChunker:
 
         assert len(chunks) == 1
         assert chunks[0]["metadata"]["location"]["slide_numbers"] == [1, 2, 3]
+
+    def test_title_extracted_from_first_h1(self, chunker):
+        """Test that the first H1 becomes the chunk title, ignoring H2."""
+        text = "## Agenda\nIntro\n# Quarterly Results\nBody\n# Second Title"
+        chunks = chunker.chunk(text)
+
+        assert chunks[0]["metadata"]["title"] == "Quarterly Results"
+        assert chunks[0]["metadata"]["hasTitle"] is True
+
+    def test_no_title_without_h1(self, chunker):
+        """Test that slides without an H1 have no title."""
+        chunks = chunker.chunk("Plain slide text\n#\nNot a heading")
+
+        assert chunks[0]["metadata"]["title"] is None
+        assert chunks[0]["metadata"]["hasTitle"] is False
+
+    def test_title_search_keeps_line_crossing_window(self, chunker):
+        """Test that an H1 straddling the search window is returned whole."""
+        text = "x" * 2040 + "\n# Long Title Past The Window\nBody"
+        chunks = chunker.chunk(text)
+
+        assert chunks[0]["metadata"]["title"] == "Long Title Past The Window"
@@ -0,0 +1,65 @@
+# apps/ai-worker/tests/test_router.py
+"""
+Unit tests for format routing.
+Tests converter lookup and lazy loading of converter modules.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.converters import CsvConverter, PyMuPDFConverter, XlsxConverter
+from src.router import get_converter, get_pdf_converter, is_supported_format
+
+
+class TestGetConverter:
+    """Tests for get_converter() and get_pdf_converter()."""
+
+    def test_returns_converter_for_format(self):
+        """Formats resolve to their converter classes (case-insensitive)."""
+        assert isinstance(get_converter("csv"), CsvConverter)
+        assert isinstance(get_converter("XLSX"), XlsxConverter)
+
+    def test_unsupported_format_raises(self):
+        """Unknown formats raise ValueError."""
+        assert not is_supported_format("exe")
+        with pytest.raises(ValueError):
+            get_converter("exe")
+
+    def test_pdf_defaults_to_pymupdf(self):
+        """PDF converter defaults to PyMuPDF."""
+        assert isinstance(get_pdf_converter(), PyMuPDFConverter)
+
+
+def test_router_import_does_not_load_pandas():
+    """Importing the router defers converter dependencies until first use."""
+    code = (
+        "import sys; import src.router; "
+        "assert 'pandas' not in sys.modules; "
+        "src.router.get_converter('xlsx'); "
+        "assert 'pandas' in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        check=True,
+    )
+
+
+def test_utf8_text_conversion_does_not_load_chardet():
+    """chardet is only imported for files that are not valid UTF-8."""
+    code = (
+        "import asyncio, sys, tempfile; "
+        "from src.router import get_converter; "
+        "f = tempfile.NamedTemporaryFile(suffix='.txt', delete=False); "
+        "f.write('héllo'.encode('utf-8')); f.close(); "
+        "asyncio.run(get_converter('txt').to_markdown(f.name)); "
+        "assert 'chardet' not in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        check=True,
+    )
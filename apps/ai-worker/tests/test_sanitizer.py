@@ -109,3 +109,14 @@ class TestInputSanitizer:
         assert "\r" not in result
         # Trailing whitespace stripped
         assert "  \n" not in result
+
+    def test_ascii_fast_path_matches_ftfy(self, sanitizer):
+        """ASCII text skipping ftfy gets the same line break handling."""
+        text = "a\r\x1d\nb\r\nc"
+        result = sanitizer.sanitize(text)
+        assert result == "a\n\nb\nc"
+
+    def test_ascii_html_entities_unescaped(self, sanitizer):
+        """ASCII text with HTML entities still goes through ftfy."""
+        result = sanitizer.sanitize("Fish &amp; Chips")
+        assert result == "Fish & Chips"
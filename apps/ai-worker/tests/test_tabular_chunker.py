@@ -27,6 +27,15 @@ class TestTabularChunker:
         assert "Alice" in chunks[0]["content"]
         assert chunks[0]["metadata"]["chunk_type"] == "tabular"
 
+    def test_converter_table_separator_detected(self, chunker):
+        """Test that converter-style separators (| --- |) are detected as tables."""
+        text = "# Sheet1\n| Name | Age |\n| --- | --- |\n| Alice | 30 |"
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) == 1
+        assert chunks[0]["content"] == text
+        assert chunks[0]["metadata"]["breadcrumbs"] == ["Sheet1"]
+
     def test_sentence_format_splitting(self, chunker):
         """Test that sentence-based row format is split by rows_per_chunk."""
         # Each "row" is "**H:** V; ..." followed by a blank line
@@ -100,6 +100,13 @@ class TestJsonConverter:
         assert "```" in result.markdown
         assert "{invalid json content" in result.markdown
 
+    def test_non_standard_json_falls_back_to_stdlib(self, json_converter):
+        """NaN/Infinity (rejected by orjson) still pretty-print as JSON."""
+        markdown = json_converter._json_to_markdown('{"a": NaN}', "nan.json")
+
+        assert "```json" in markdown
+        assert '"a": NaN' in markdown
+
     @pytest.mark.asyncio
     async def test_process_tabular_json(self, json_converter, tmp_path):
         """Tabular JSON converted to sentence serialization."""